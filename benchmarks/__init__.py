@@ -0,0 +1 @@
+"""Benchmarks that are run locally (e.g. `make bench-memory`), rather than as part of the tests."""
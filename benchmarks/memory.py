@@ -0,0 +1,209 @@
+"""Memory benchmark for the table builders, with a regression gate against stored baselines.
+
+The peak memory (while building) and retained memory (held by the finished table) are measured
+using `tracemalloc` at several data sizes. Allocations differ between Python versions, so the
+baselines are stored for each version.
+
+Usage:
+    python -m benchmarks.memory            # compare against the baselines (exit code 1 on regression,
+                                           # or when there are no baselines for this Python version)
+    python -m benchmarks.memory --update   # store the current measurements as the baselines
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from rich_objects.columnar import ColumnarData
+from rich_objects.display import TableBuilder
+from rich_objects.display import rich_table_factory
+from rich_objects.rich_table import RichTable
+from rich_objects.table_config import TableConfig
+
+BASELINE_FILE = Path(__file__).with_name("memory_baseline.json")
+SIZES = (100, 1000, 5000)
+# allowed growth over the baseline before failing
+THRESHOLD = 0.10
+# growth below this many bytes is noise (e.g. interned strings, or caches)
+MIN_REGRESSION_BYTES = 16 * 1024
+
+
+@dataclass
+class Measurement:
+    """Memory used to build a table."""
+
+    peak: int
+    retained: int
+    rows: int
+
+    @property
+    def peak_per_row(self) -> float:
+        """Get the peak memory for each row."""
+        return self.peak / self.rows if self.rows else 0.0
+
+
+def nested_records(size: int) -> list[dict[str, Any]]:
+    """Create a list of records with nested objects and lists (e.g. an API response)."""
+    return [
+        {
+            "name": f"item-{i:06d}",
+            "status": "ok" if i % 3 else "failed",
+            "labels": {"region": f"region-{i % 7}", "tier": i % 3, "tags": [f"t{i % 5}", f"t{i % 11}"]},
+            "history": [{"name": f"event-{j}", "count": i * j} for j in range(3)],
+        }
+        for i in range(size)
+    ]
+
+
+def _table_factory(size: int) -> Callable[[], Any]:
+    data = nested_records(size)
+    return lambda: rich_table_factory(data)
+
+
+def _table_factory_iterator(size: int) -> Callable[[], Any]:
+    data = nested_records(size)
+    return lambda: rich_table_factory(iter(data))
+
+
+def _object_table(size: int) -> Callable[[], Any]:
+    data = {f"key-{i:06d}": {"value": i, "text": f"text-{i}"} for i in range(size)}
+
+    def build() -> Any:
+        builder = TableBuilder(TableConfig())
+        return builder.build(builder.object_table(data, outer=True))
+
+    return build
+
+
+def _rich_table(size: int) -> Callable[[], Any]:
+    def build() -> Any:
+        table = RichTable("Name", "Properties")
+        for i in range(size):
+            inner = RichTable.inner("Property", "Value")
+            inner.add_row("count", str(i))
+            table.add_row(f"item-{i}", inner)
+        return table
+
+    return build
+
+
+def _columnar(size: int) -> Callable[[], Any]:
+    data = ColumnarData({"id": list(range(size)), "name": [f"item-{i}" for i in range(size)]})
+    return lambda: rich_table_factory(data)
+
+
+# each case creates a function that builds a table with the provided number of rows
+CASES: dict[str, Callable[[int], Callable[[], Any]]] = {
+    "rich_table_factory": _table_factory,
+    "rich_table_factory_iterator": _table_factory_iterator,
+    "object_table": _object_table,
+    "rich_table": _rich_table,
+    "columnar": _columnar,
+}
+
+
+def measure(build: Callable[[], Any], rows: int) -> Measurement:
+    """Measure the peak and retained memory of the build (the input data is created beforehand)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        result = build()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return Measurement(peak=peak - start, retained=current - start, rows=rows)
+
+
+def run(sizes: Iterable[int] = SIZES, cases: Optional[Iterable[str]] = None) -> dict[str, Measurement]:
+    """Measure each case at each size."""
+    results = {}
+    for name in cases or CASES:
+        for size in sizes:
+            build = CASES[name](size)
+            # warm up the caches (e.g. templates, and schemas) so they are not counted
+            CASES[name](1)()
+            results[f"{name}/{size}"] = measure(build, size)
+    return results
+
+
+def compare(
+    results: dict[str, Measurement], baselines: dict[str, Any], threshold: float = THRESHOLD
+) -> list[str]:
+    """Get a message for each measurement that exceeds its baseline by more than the threshold."""
+    failures = []
+    for key, measurement in results.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            continue
+        for metric in ("peak", "retained"):
+            value = getattr(measurement, metric)
+            limit = baseline[metric] * (1 + threshold)
+            if value > limit and value - baseline[metric] > MIN_REGRESSION_BYTES:
+                failures.append(f"{key} {metric}: {value:,} bytes (baseline {baseline[metric]:,}, limit {limit:,.0f})")
+    return failures
+
+
+def python_version() -> str:
+    """Get the key for the baselines of this Python version."""
+    return f"{platform.python_implementation()}-{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def load_baselines(path: Path = BASELINE_FILE) -> dict[str, Any]:
+    """Load the baselines for all Python versions."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baselines(results: dict[str, Measurement], path: Path = BASELINE_FILE) -> None:
+    """Store the results as the baselines for this Python version."""
+    baselines = load_baselines(path)
+    baselines[python_version()] = {
+        key: {"peak": m.peak, "retained": m.retained} for key, m in sorted(results.items())
+    }
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+    return
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmark, and compare against (or update) the baselines."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description=__doc__.split("\n")[0])
+    parser.add_argument("--update", action="store_true", help="store the results as the baselines")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed growth (default=%(default)s)")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="cases to run (default=all)")
+    args = parser.parse_args(argv)
+
+    results = run(cases=args.case)
+    for key, m in results.items():
+        print(f"{key:40} peak {m.peak:>12,}  retained {m.retained:>12,}  peak/row {m.peak_per_row:>10,.0f}")
+
+    if args.update:
+        save_baselines(results)
+        print(f"Stored baselines for {python_version()} in {BASELINE_FILE.name}")
+        return 0
+
+    baselines = load_baselines().get(python_version())
+    if baselines is None:
+        # nothing to compare against is a failure, so the gate never passes without checking
+        print(f"No baselines for {python_version()} (use --update to store them)")
+        return 1
+    failures = compare(results, baselines, args.threshold)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
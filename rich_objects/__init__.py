@@ -1,9 +1,19 @@
 """Module for rich display of complex objects (e.g. JSON/dict)."""
 
+from rich_objects.columnar import ColumnarData
 from rich_objects.console import console_factory
+from rich_objects.console import thread_console
 from rich_objects.display import display
+from rich_objects.display import export_targets
 from rich_objects.display import rich_table_factory
 from rich_objects.enums import OutputFormat
 from rich_objects.enums import OutputStyle
+from rich_objects.export import export_html
+from rich_objects.export import export_svg
+from rich_objects.filters import compile_where
+from rich_objects.live import LiveDisplay
+from rich_objects.pager import LazyPager
+from rich_objects.render_cache import RenderCache
 from rich_objects.rich_table import RichTable
+from rich_objects.streaming import read_json
 from rich_objects.table_config import TableConfig
@@ -0,0 +1,50 @@
+"""Command line for displaying JSON (or JSON Lines) from a file or stdin."""
+import argparse
+import sys
+from typing import Optional
+
+from rich_objects.display import display
+from rich_objects.enums import OutputFormat
+from rich_objects.enums import OutputStyle
+from rich_objects.streaming import STDIN
+from rich_objects.streaming import read_json
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Parse the arguments, and display the data."""
+    parser = argparse.ArgumentParser(
+        prog="python -m rich_objects",
+        description="Display JSON (or JSON Lines) data, reading top-level arrays one element at a time.",
+    )
+    parser.add_argument("source", nargs="?", default=STDIN, help="file to read (default: stdin)")
+    parser.add_argument(
+        "--fmt", default=OutputFormat.TABLE.value, choices=[f.value for f in OutputFormat],
+        help="output format (default: table)",
+    )
+    parser.add_argument(
+        "--style", default=OutputStyle.ALL.value, choices=[s.value for s in OutputStyle],
+        help="output style (default: all)",
+    )
+    parser.add_argument("--indent", type=int, default=2, help="indent for json/yaml output (default: 2)")
+    parser.add_argument("--columns", help="comma-separated list of columns to display")
+    parser.add_argument(
+        "--lines", action=argparse.BooleanOptionalAction, default=None,
+        help="input is JSON Lines (default: detect from the data)",
+    )
+    parser.add_argument("--no-mmap", action="store_true", help="do not memory-map the input file")
+    args = parser.parse_args(argv)
+
+    columns = args.columns.split(",") if args.columns else None
+    try:
+        obj = read_json(args.source, lines=args.lines, use_mmap=not args.no_mmap)
+        display(
+            obj, fmt=OutputFormat(args.fmt), style=OutputStyle(args.style), indent=args.indent, columns=columns
+        )
+    except (OSError, ValueError) as ex:
+        print(f"Error: {ex}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
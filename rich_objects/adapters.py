@@ -0,0 +1,159 @@
+"""Adapters to read fields directly from dataclasses, NamedTuples, slotted objects, and similar."""
+import dataclasses
+import sys
+import sysconfig
+from collections.abc import Iterator
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+from typing import Optional
+
+import yaml
+
+# methods that are checked (in order) for objects that know how to convert themselves to a dict
+DICT_METHODS = ["to_dict", "model_dump"]
+
+# types that are never treated as records (checked by identity to keep the common case fast)
+_PLAIN_TYPES = frozenset([str, int, float, bool, list, type(None)])
+
+# location of the standard library modules
+STDLIB_PATH = sysconfig.get_paths()["stdlib"]
+
+
+class ObjectView(Mapping):
+    """Read-only mapping of the fields of an object, without copying any values.
+
+    The field names are provided by the caller (typically cached per-class), and values are read
+    from the underlying object on access.
+    """
+
+    __slots__ = ("_fields", "_obj")
+
+    def __init__(self, obj: Any, fields: tuple[str, ...]):
+        """Initialize the view with the object and the field names to expose."""
+        self._obj = obj
+        self._fields = fields
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get the value of the named field."""
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self._obj, key)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check for the field name without reading the value."""
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names."""
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        """Get the number of fields."""
+        return len(self._fields)
+
+
+def _slot_fields(cls: type) -> tuple[str, ...]:
+    """Get the names of all the slots defined in the class hierarchy."""
+    fields: list[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            # private slots (e.g. pathlib, ipaddress) are implementation details, not fields
+            if name.startswith("_") or name in fields:
+                continue
+            fields.append(name)
+    return tuple(fields)
+
+
+def _is_library_class(cls: type) -> bool:
+    """Check whether the class is from the standard library (e.g. `uuid.UUID`), rather than the user."""
+    module = (cls.__module__ or "").partition(".")[0]
+    names = getattr(sys, "stdlib_module_names", None)
+    if names is not None:
+        return module in names
+    # before Python 3.10, check where the module was loaded from
+    file = getattr(sys.modules.get(module), "__file__", None)
+    return file is None or (file.startswith(STDLIB_PATH) and "site-packages" not in file)
+
+
+@lru_cache(maxsize=None)
+def record_fields(cls: type) -> Optional[tuple[str, ...]]:
+    """Get the field names for instances of the class (or None, if not a supported record type).
+
+    This introspection is done once per class, and the result is cached.
+    """
+    if dataclasses.is_dataclass(cls):
+        return tuple(f.name for f in dataclasses.fields(cls))
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        return tuple(cls._fields)
+    # slotted classes from the standard library (e.g. UUID) are values, so they are displayed as strings
+    if _is_library_class(cls):
+        return None
+    if "__dict__" not in dir(cls) and any("__slots__" in k.__dict__ for k in cls.__mro__[:-1]):
+        return _slot_fields(cls) or None
+    return None
+
+
+@lru_cache(maxsize=None)
+def _dict_method(cls: type) -> Optional[str]:
+    """Get the name of the method used to convert the object to a dict (if any)."""
+    for name in DICT_METHODS:
+        if callable(getattr(cls, name, None)):
+            return name
+    return None
+
+
+def as_mapping(obj: Any) -> Optional[Mapping]:
+    """Get a mapping for the object, if it is one of the supported record types (otherwise, None)."""
+    if isinstance(obj, dict):
+        return obj
+    cls = type(obj)
+    if cls in _PLAIN_TYPES:
+        return None
+    if isinstance(obj, Mapping):
+        return obj
+    fields = record_fields(cls)
+    if fields is not None:
+        return ObjectView(obj, fields)
+    method = _dict_method(cls)
+    if method is not None:
+        return getattr(obj, method)()
+    return None
+
+
+def json_default(obj: Any) -> Any:
+    """Allow records (e.g. dataclasses) to be serialized by the json module."""
+    mapping = as_mapping(obj)
+    if mapping is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return dict(mapping)
+
+
+class RecordDumper(yaml.Dumper):
+    """YAML dumper that writes records (e.g. dataclasses) as mappings, rather than Python objects."""
+
+    def represent_record(self, data: Any) -> Any:
+        """Represent a record as a mapping (other objects use the default representation)."""
+        mapping = as_mapping(data)
+        if mapping is None:
+            return self.represent_object(data)
+        return self.represent_dict(dict(mapping))
+
+
+# checked for anything without a representer for its exact type (e.g. including NamedTuples)
+RecordDumper.add_multi_representer(object, RecordDumper.represent_record)
+
+
+def is_record(obj: Any) -> bool:
+    """Check if the object is a dict or one of the supported record types."""
+    if isinstance(obj, dict):
+        return True
+    cls = type(obj)
+    if cls in _PLAIN_TYPES:
+        return False
+    if isinstance(obj, Mapping):
+        return True
+    return record_fields(cls) is not None or _dict_method(cls) is not None
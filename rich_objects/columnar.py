@@ -0,0 +1,112 @@
+"""Support for columnar data (e.g. dict-of-lists, or NumPy structured arrays)."""
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+
+from rich.markup import escape
+
+
+def _is_ndarray(obj: Any) -> bool:
+    """Check for a NumPy array (without importing NumPy)."""
+    return hasattr(obj, "dtype") and hasattr(obj, "tolist") and hasattr(obj, "astype")
+
+
+def is_structured_array(obj: Any) -> bool:
+    """Check for a NumPy structured array (e.g. with named fields)."""
+    return _is_ndarray(obj) and getattr(obj.dtype, "names", None) is not None
+
+
+class ColumnarData:
+    """Container for data organized by column, rather than a list of row dictionaries.
+
+    The columns are kept as provided (e.g. lists or NumPy arrays), so column-level operations can
+    be done in batches without creating a dictionary for each row.
+    """
+
+    def __init__(self, data: Any):
+        """Initialize from a mapping of column name to values, or a NumPy structured array."""
+        if is_structured_array(data):
+            self.names = [str(n) for n in data.dtype.names]
+            self.columns: list[Sequence[Any]] = [data[n] for n in data.dtype.names]
+        elif isinstance(data, Mapping):
+            self.names = [str(n) for n in data.keys()]
+            self.columns = list(data.values())
+        else:
+            raise ValueError(f"Unable to create columns for type {type(data).__name__}")
+
+        lengths = {len(c) for c in self.columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return self._length
+
+    def values(self, index: int) -> list[Any]:
+        """Get the values of a column as Python objects (e.g. converting NumPy scalars)."""
+        column = self.columns[index]
+        if _is_ndarray(column):
+            return column.tolist()
+        return list(column)
+
+    def strings(self, index: int) -> list[str]:
+        """Get the values of a column converted to strings in a single batch."""
+        column = self.columns[index]
+        if _is_ndarray(column) and column.dtype.kind in "biufU":
+            return column.astype(str).tolist()
+        return list(map(str, column))
+
+    def select(self, indices: list[int]) -> "ColumnarData":
+        """Get the rows at the indices (in order), keeping each column's type (e.g. a NumPy array)."""
+        columns = [
+            column[indices] if _is_ndarray(column) else [column[i] for i in indices]
+            for column in self.columns
+        ]
+        return ColumnarData(dict(zip(self.names, columns)))  # noqa: B905
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the rows as dictionaries (for outputs that require them, e.g. YAML)."""
+        columns = [self.values(i) for i in range(len(self.columns))]
+        for row in zip(*columns):  # noqa: B905
+            yield dict(zip(self.names, row))  # noqa: B905
+
+
+class RowView(Mapping):
+    """Read-only mapping of one row of columnar data, which is moved between rows (by setting `index`).
+
+    The values are read from the columns by position, so checking each row (e.g. for a filter)
+    does not create a dictionary for it.
+    """
+
+    __slots__ = ("_columns", "_positions", "index")
+
+    def __init__(self, data: ColumnarData, index: int = 0):
+        """Initialize the view of the row (the columns are converted to Python objects once)."""
+        self._columns = [data.values(i) for i in range(len(data.columns))]
+        self._positions = {name: i for i, name in enumerate(data.names)}
+        self.index = index
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get the value of the named column in the current row."""
+        return self._columns[self._positions[key]][self.index]
+
+    def __contains__(self, key: Any) -> bool:
+        """Check for the column name."""
+        return key in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the column names."""
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        """Get the number of columns."""
+        return len(self._positions)
+
+
+def escape_column(values: list[str]) -> list[str]:
+    """Escape markup in all the values, skipping the work if there's nothing to escape."""
+    if not any("[" in v for v in values):
+        return values
+    return [escape(v) for v in values]
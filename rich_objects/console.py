@@ -1,10 +1,22 @@
-"""Module containing a factory for generating a rich Console."""
+"""Module containing a factory for generating a rich Console.
+
+Concurrency model: the defaults (e.g. `DEFAULT_ROW_PROPS`) are immutable, and each `TableConfig`
+gets its own copies, so tables can be built in parallel threads. The output of `display()` is
+rendered in the calling thread, and only the write to the console is serialized (using
+`OUTPUT_LOCK`), so the output of a table is never interleaved with other output.
+"""
 import os
+import threading
 
 from rich.console import Console
 
 TEST_TERMINAL_WIDTH = 100
 
+# serializes the writes from all the consoles (which usually share stdout)
+OUTPUT_LOCK = threading.RLock()
+
+_thread_data = threading.local()
+
 
 def console_factory(*args, **kwargs) -> Console:
     """Create/initialize a Console object.
@@ -22,3 +34,15 @@ def console_factory(*args, **kwargs) -> Console:
     elif pytest_version is not None:
         width = TEST_TERMINAL_WIDTH
     return Console(*args, width=width, **kwargs)
+
+
+def thread_console(**kwargs) -> Console:
+    """Get the console for the current thread (created using console_factory on first use).
+
+    The keyword arguments are only used when the console is created.
+    """
+    console = getattr(_thread_data, "console", None)
+    if console is None:
+        console = console_factory(**kwargs)
+        _thread_data.console = console
+    return console
@@ -1,5 +1,6 @@
 """Internationalized constants for controlling appearance."""
 from gettext import gettext
+from types import MappingProxyType
 
 # allow for i18n/l8n
 ITEMS = gettext("Items")
@@ -9,22 +10,31 @@ VALUE = gettext("Value")
 VALUES = gettext("Values")
 UNKNOWN = gettext("Unknown")
 FOUND_ITEMS = gettext("Found {} items")
+PAGE_ITEMS = gettext("Items {}-{}")
+SUMMARY_ITEMS = gettext("{} items: {}, ...")
+SUMMARY_MORE = gettext("... {} more")
+SUMMARY_STATS = gettext("min={}, max={}, mean={}")
+PAGE_PROMPT = gettext("Page {} (Enter: next, b: back, q: quit) ")
 ELLIPSIS = gettext("...")
+CIRCULAR = gettext("<circular reference>")
 
-OBJECT_HEADERS = [PROPERTY, VALUE]
+# the defaults are immutable, since they are shared (e.g. by every table, and thread)
+OBJECT_HEADERS = (PROPERTY, VALUE)
 
-KEY_FIELDS = ["name", "id"]
-URL_PREFIXES = ["http://", "https://", "ftp://"]
+KEY_FIELDS = ("name", "id")
+URL_PREFIXES = ("http://", "https://", "ftp://")
 
 KEY_MAX_LEN = 35
 VALUE_MAX_LEN = 50
 URL_MAX_LEN = 100
+SUMMARY_ITEMS_SHOWN = 5
+SCHEMA_SAMPLE = 1000
 
 # this is value used to denote all other properties (not specified in list)
 WILDCARD_COLUMN = '*'
 
-DEFAULT_ROW_PROPS = {
+DEFAULT_ROW_PROPS = MappingProxyType({
     "justify": "left",
     "no_wrap": True,
     "overflow": "ignore",
-}
+})
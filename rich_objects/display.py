@@ -1,23 +1,89 @@
 """Implementation for displaying data in a user-friendly fashion."""
+import copy
+import io
+import os
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import ExitStack
 from typing import Any
 from typing import Optional
+from typing import TextIO
+from typing import Union
 
 import yaml
 from rich.console import Console
 from rich.markup import escape
-
+from rich.text import Text
+
+from rich_objects.adapters import RecordDumper
+from rich_objects.adapters import as_mapping
+from rich_objects.adapters import is_record
+from rich_objects.adapters import json_default
+from rich_objects.columnar import ColumnarData
+from rich_objects.columnar import escape_column
+from rich_objects.columnar import is_structured_array
+from rich_objects.console import OUTPUT_LOCK
 from rich_objects.console import console_factory
 from rich_objects.constants import ELLIPSIS
 from rich_objects.constants import PROPERTIES
 from rich_objects.constants import WILDCARD_COLUMN
 from rich_objects.enums import OutputFormat
 from rich_objects.enums import OutputStyle
+from rich_objects.export import export_html
+from rich_objects.export import export_svg
+from rich_objects.filters import Where
+from rich_objects.filters import apply_where
+from rich_objects.render_cache import RenderCache
+from rich_objects.render_cache import content_hash
 from rich_objects.rich_table import RichTable
+from rich_objects.rich_table import text_cell
+from rich_objects.schema import infer_schema
+from rich_objects.schema import sample_items
+from rich_objects.streaming import NOTHING
+from rich_objects.streaming import peek
 from rich_objects.table_config import TableConfig
+from rich_objects.writers import CsvWriter
+from rich_objects.writers import JsonlWriter
+from rich_objects.writers import JsonWriter
+from rich_objects.writers import YamlWriter
+from rich_objects.writers import write_csv
+from rich_objects.writers import write_json
+from rich_objects.writers import write_jsonl
+from rich_objects.writers import write_yaml
 
 # NOTE: the key field of dictionaries are expected to be be `str`, `int`, `float`, but use
 #       `Any` readability.
 
+# formats that export the table as markup
+EXPORTERS = {
+    OutputFormat.HTML: export_html,
+    OutputFormat.SVG: export_svg,
+}
+
+# formats that are written as the data is read
+STREAMED_FORMATS = (OutputFormat.CSV, OutputFormat.JSONL, *EXPORTERS)
+
+# formats that display the table, so it is only built once when exporting to several targets
+TABLE_FORMATS = (OutputFormat.TABLE, *EXPORTERS)
+
+# where an export target is written: a console, text file, or the path of a file
+Destination = Union[Console, TextIO, str, os.PathLike]
+# writes the items of a list in a record-oriented format (or as a table per record), one at a time
+RecordWriter = Union[CsvWriter, JsonlWriter, JsonWriter, YamlWriter, "VerticalWriter"]
+
+# estimated padding (and borders) for each column of outer/inner tables
+OUTER_COLUMN_PADDING = 3
+INNER_COLUMN_PADDING = 2
+# nested values beyond this depth are not included in the width estimate
+MAX_ESTIMATE_DEPTH = 8
+# number of list items used for the width estimate
+ESTIMATE_SAMPLE = 3
+
+# identifies tables built from a list (objects use a tuple of excluded keys)
+LIST_ROLE = "list"
+
 
 def headerize(s: str) -> str:
     """Create a table header from the provided string."""
@@ -33,7 +99,7 @@ def _truncate(s: str, max_length: int) -> str:
     return s[: max_length - 3] + ELLIPSIS
 
 
-def _get_name_key(item: dict[Any, Any], key_fields: list[str]) -> Optional[str]:
+def _get_name_key(item: Mapping[Any, Any], key_fields: list[str]) -> Optional[str]:
     """Attempt to find an identifying value."""
     for k in key_fields:
         key = str(k)
@@ -43,7 +109,7 @@ def _get_name_key(item: dict[Any, Any], key_fields: list[str]) -> Optional[str]:
     return None
 
 
-def _get_other_key(item: dict[Any, Any], name_key: str) -> Optional[str]:
+def _get_other_key(item: Mapping[Any, Any], name_key: str) -> Optional[str]:
     """Find the "other" key (if there's just one value)."""
     keys = set(item.keys())
     keys.remove(name_key)
@@ -63,171 +129,594 @@ def _safe(v: Any) -> str:
     return escape(str(v))
 
 
-def _create_list_table(
-    items: list[dict[Any, Any]], outer: bool, config: TableConfig
-) -> RichTable:
-    """Create a table from a list of dictionary items.
+def _is_scalar(item: Any) -> bool:
+    """Check for a "simple" property value."""
+    return item is None or isinstance(item, (str, float, bool, int))
 
-    If an identifying "name key" is found (in the first entry), the table will have 2 columns: name, Properties
-    If no identifying "name key" is found, the table will be a single column table with the properties.
 
-    NOTE: nesting is done as needed
-    """
-    caption = config.items_caption.format(len(items)) if outer else None
-    name_key = _get_name_key(items[0], config.key_fields)
-    if not name_key:
-        # without identifiers just create table with one "Values" column
-        table = RichTable(
-            config.values_label,
-            outer=outer,
-            show_lines=True,
-            caption=caption,
-            row_props=config.row_properties,
-        )
-        for item in items:
-            table.add_row(_table_cell_value(item, config))
-        return table
+def _record(item: Any) -> Any:
+    """Get a mapping for dataclasses, NamedTuples, etc. (other items are returned as-is)."""
+    mapping = as_mapping(item)
+    return item if mapping is None else mapping
 
-    # if there's just one property besides the key, use that as the label
-    name_label = headerize(name_key)
-    other_key = _get_other_key(items[0], name_key)
-    if other_key:
-        other_name = headerize(other_key)
-        fields = [name_label, other_name]
-        table = RichTable(
-            *fields,
-            outer=outer,
-            show_lines=True,
-            caption=caption,
-            row_props=config.row_properties,
-        )
-        for item in items:
-            # id may be an int, so convert to string before truncating
-            name = _safe(item.pop(name_key, config.unknown_label))
-            body = _table_cell_value(item.get(other_key), config)
-            table.add_row(_truncate(name, config.key_max_len), body)
-        return table
 
-    # create a table with identifier in left column, and rest of data in right column
-    fields = [name_label, config.properties_label]
-    table = RichTable(
-        *fields,
-        outer=outer,
-        show_lines=True,
-        caption=caption,
-        row_props=config.row_properties,
-    )
-    for item in items:
-        # id may be an int, so convert to string before truncating
-        name = _safe(item.pop(name_key, config.unknown_label))
-        body = _table_cell_value(item, config)
-        table.add_row(_truncate(name, config.key_max_len), body)
+def _numeric_stats(values: list[Any]) -> Optional[tuple[Any, Any, float]]:
+    """Get the min, max, and mean of a list of numbers (None when not all numbers)."""
+    # each of these is a single loop in C, rather than converting the values
+    types = set(map(type, values))
+    if not types or not types <= {int, float}:
+        return None
+    return min(values), max(values), sum(values) / len(values)
 
-    return table
 
+def _summary_stats(values: list[Any], config: TableConfig) -> Optional[str]:
+    """Describe the min/max/mean of the values (None when not all numbers)."""
+    stats = _numeric_stats(values)
+    if stats is None:
+        return None
+    low, high, mean = stats
+    return config.stats_label.format(low, high, round(mean, 4))
 
-def _create_object_table(
-    obj: dict[Any, Any], outer: bool, config: TableConfig
-) -> RichTable:
-    """Create a table of a dictionary object.
 
-    NOTE: nesting is done in the right column as needed.
-    """
-    headers = [config.property_label, config.value_label]
-    table = RichTable(
-        *headers, outer=outer, show_lines=False, row_props=config.row_properties
-    )
-    for k, v in obj.items():
-        name = _safe(k)
-        table.add_row(_truncate(name, config.key_max_len), _table_cell_value(v, config))
+def _is_summarized(values: Any, config: TableConfig) -> bool:
+    """Check whether the list is long enough to be summarized."""
+    return config.summary_threshold is not None and isinstance(values, list) and len(values) > config.summary_threshold
+
 
+def _summary(values: list[Any], config: TableConfig) -> str:
+    """Summarize a long list of scalars, only converting the items that are shown."""
+    shown = ", ".join(str(v) for v in values[:config.summary_items])
+    text = config.summary_label.format(len(values), _truncate(shown, config.value_max_len))
+    stats = _summary_stats(values, config)
+    return text if stats is None else f"{text} ({stats})"
+
+
+def _add_caption(table: RichTable, outer: bool, config: TableConfig) -> RichTable:
+    """Add the item count caption to outer tables (after the rows are added, so items can be streamed)."""
+    if outer:
+        table.caption = config.items_caption.format(table.row_count)
     return table
 
 
-def _table_cell_value(obj: Any, config: TableConfig) -> Any:
-    """Create the "inner" value for a table cell.
+def _new_table(headers: list[str], outer: bool, show_lines: bool, config: TableConfig) -> RichTable:
+    """Create a table, sharing the column definitions for inner tables (there can be many of them)."""
+    if outer:
+        return RichTable(*headers, outer=True, show_lines=show_lines, row_props=config.row_properties)
+    return RichTable.inner(*headers, show_lines=show_lines, row_props=config.row_properties)
+
+
+# rows of a table are produced one at a time, so nested tables can be filled in between
+_Rows = Iterator[list[Any]]
+# headers, name key, and other key of a list table
+_Layout = tuple[list[str], Optional[str], Optional[str]]
+
+
+class TableBuilder:
+    """Builds nested tables using an explicit work stack, rather than recursion.
 
-    Depending on the input value type, the cell may look different. If a dict, or list[dict],
-    an inner table is created. Otherwise, the object is converted to a printable value.
+    Each table is paired with a generator that produces its rows. Nested tables are created (empty)
+    when a row is produced, and their generators are pushed onto the stack, so they are filled before
+    the next row of the parent (e.g. depth-first).
+
+    Objects are tracked by `id()`:
+    * an object that is being filled (e.g. an ancestor) is a cycle, so a placeholder is displayed
+    * a completed table is reused when the same object is found again (e.g. a shared sub-object)
     """
-    value: Any = None
-    if isinstance(obj, dict):
-        value = _create_object_table(obj, outer=False, config=config)
-    elif isinstance(obj, list) and obj:
-        if isinstance(obj[0], dict):
-            value = _create_list_table(obj, outer=False, config=config)
-        else:
+
+    def __init__(self, config: TableConfig, streaming: bool = False):
+        """Initialize the builder (streaming forgets completed tables between top-level items)."""
+        self.config = config
+        self._streaming = streaming
+        self._stack: list[tuple[RichTable, _Rows]] = []
+        self._active: set[int] = set()
+        # keeps a reference to the object, so the id() is not reused while the table is cached
+        self._built: dict[tuple[int, Any], tuple[Any, RichTable]] = {}
+
+    def fill(self) -> None:
+        """Fill all the queued tables."""
+        stack = self._stack
+        while stack:
+            parent, rows = stack[-1]
+            row = next(rows, None)
+            if row is None:
+                stack.pop()
+                continue
+            parent.add_row(*row)
+        return
+
+    def build(self, table: RichTable) -> RichTable:
+        """Fill all the queued tables, and return the provided (outer) table."""
+        self.fill()
+        return table
+
+    def _nested(self, obj: Any, role: Any) -> Optional[Any]:
+        """Get the cell for an object that is a cycle, or was already built (otherwise, None)."""
+        if id(obj) in self._active:
+            return self.config.circular_label
+        built = self._built.get((id(obj), role))
+        return None if built is None else built[1]
+
+    def _push(self, table: RichTable, rows: _Rows) -> RichTable:
+        """Queue the rows to be added to the table."""
+        self._stack.append((table, rows))
+        return table
+
+    def _track(self, obj: Any, role: Any, table: RichTable, rows: Iterable[list[Any]]) -> _Rows:
+        """Mark the object active while producing its rows, and remember the completed table."""
+        self._active.add(id(obj))
+        yield from rows
+        self._active.discard(id(obj))
+        self._built[(id(obj), role)] = (obj, table)
+
+    def object_table(self, obj: Any, outer: bool, exclude: tuple[Any, ...] = ()) -> RichTable:
+        """Create a table of a dictionary (or other mapping) object.
+
+        NOTE: nesting is done in the right column as needed.
+        """
+        config = self.config
+        headers = [config.property_label, config.value_label]
+        table = _new_table(headers, outer, False, config)
+        mapping = _record(obj)
+        rows = (
+            [self.text(k, config.key_max_len), self.cell_value(v)]
+            for k, v in mapping.items()
+            if k not in exclude
+        )
+        return self._push(table, self._track(obj, exclude, table, rows))
+
+    def list_table(self, items: Iterable[Any], outer: bool) -> RichTable:
+        """Create a table from a list (or iterator) of dictionary (or other record) items.
+
+        If an identifying "name key" is found (in the first entry), the table will have 2 columns: name, Properties
+        If no identifying "name key" is found, the table will be a single column table with the properties.
+
+        NOTE: nesting is done as needed
+        """
+        source = items
+        (fields, name_key, other_key), items = self.layout(items)
+        table = _new_table(fields, outer, True, self.config)
+        rows = self._list_rows(table, items, outer, name_key, other_key)
+        return self._push(table, self._track(source, LIST_ROLE, table, rows))
+
+    def layout(self, items: Iterable[Any]) -> tuple[_Layout, Iterable[Any]]:
+        """Get the layout for a list table, and the items (since an iterator may be read to choose it)."""
+        config = self.config
+        if not config.infer_schema:
+            first, items = peek(items)
+            return self.list_layout(first), items
+
+        sample, items = sample_items(items, config.schema_sample)
+        schema = infer_schema(sample, config.key_fields)
+        return self._layout_fields(schema.name_key, schema.other_key), items
+
+    def list_layout(self, first: Any) -> _Layout:
+        """Get the headers, name key, and other key for a list table using the first item (see list_table)."""
+        record = _record(first)
+        name_key = _get_name_key(record, self.config.key_fields)
+        # if there's just one property besides the key, use that as the label
+        other_key = _get_other_key(record, name_key) if name_key else None
+        return self._layout_fields(name_key, other_key)
+
+    def _layout_fields(self, name_key: Optional[str], other_key: Optional[str]) -> _Layout:
+        """Get the headers for the list table layout."""
+        config = self.config
+        if not name_key:
+            # without identifiers just create table with one "Values" column
+            return [config.values_label], None, None
+        fields = [headerize(name_key), headerize(other_key) if other_key else config.properties_label]
+        return fields, name_key, other_key
+
+    def list_row(self, item: Any, name_key: Optional[str], other_key: Optional[str]) -> list[Any]:
+        """Create the cells for an item in a list table (nested tables are queued to be filled)."""
+        if not name_key:
+            return [self.cell_value(item)]
+
+        config = self.config
+        record = _record(item)
+        # id may be an int, so convert to string before truncating
+        name = self.text(record.get(name_key, config.unknown_label), config.key_max_len)
+        if other_key:
+            return [name, self.cell_value(record.get(other_key))]
+        return [name, self.cell_value(item, exclude=(name_key,))]
+
+    def _list_rows(
+        self, table: RichTable, items: Iterable[Any], outer: bool, name_key: Optional[str], other_key: Optional[str]
+    ) -> _Rows:
+        """Produce the rows for a list table (see list_table)."""
+        for item in items:
+            if self._streaming and outer:
+                self._built.clear()
+            row = self.list_row(item, name_key, other_key)
+
+            # the item is an ancestor of anything nested in the row
+            added = id(item) not in self._active
+            self._active.add(id(item))
+            yield row
+            if added:
+                self._active.discard(id(item))
+        _add_caption(table, outer, self.config)
+
+    def list_columns_table(self, items: Iterable[Any], columns: list[str]) -> RichTable:
+        """Create a table with the provided columns."""
+        config = self.config
+        headers = [headerize(c) for c in columns]
+        table = RichTable(
+            *headers, outer=True, show_lines=True, row_props=config.row_properties
+        )
+        return self._push(table, self._columns_rows(items, columns))
+
+    def _columns_rows(self, items: Iterable[Any], columns: list[str]) -> _Rows:
+        """Produce the rows for a table with the provided columns (see list_columns_table)."""
+        # the wildcard column displays everything not in another column
+        others = tuple(c for c in columns if c != WILDCARD_COLUMN)
+        for item in items:
+            record = _record(item)
+            yield [
+                self.cell_value(item, exclude=others) if c == WILDCARD_COLUMN else self.cell_value(record.get(c))
+                for c in columns
+            ]
+
+    def cell_value(self, obj: Any, exclude: tuple[Any, ...] = ()) -> Any:
+        """Create the "inner" value for a table cell.
+
+        Depending on the input value type, the cell may look different. If a dict, or list[dict],
+        an inner table is created (and queued to be filled). Otherwise, the object is converted to
+        a printable value.
+        """
+        config = self.config
+        if is_record(obj):
+            nested = self._nested(obj, exclude)
+            return self.object_table(obj, outer=False, exclude=exclude) if nested is None else nested
+
+        if isinstance(obj, list) and obj:
+            if is_record(obj[0]):
+                nested = self._nested(obj, LIST_ROLE)
+                return self.list_table(obj, outer=False) if nested is None else nested
+            if _is_summarized(obj, config):
+                return self.text(_summary(obj, config))
             values = [str(x) for x in obj]
-            s = _safe(", ".join(values))
-            value = _truncate(s, config.value_max_len)
-    else:
-        s = _safe(obj)
+            return self.text(", ".join(values), config.value_max_len)
+
+        s = str(obj)
         max_len = (
             config.url_max_len
             if _is_url(s, config.url_prefixes)
             else config.value_max_len
         )
-        value = _truncate(s, max_len)
-
-    return value
-
-
-def _create_list_columns_table(items: list[dict[str, Any]], columns: list[str], config: TableConfig) -> RichTable:
-    """Create a table with the provided columns."""
-    headers = [headerize(c) for c in columns]
+        return self.text(s, max_len)
+
+    def text(self, value: Any, max_len: Optional[int] = None) -> Any:
+        """Create the cell for a value displayed as text (truncated to max_len).
+
+        The value is escaped, so Rich does not interpret it as markup, unless the config uses text
+        cells (`Text` that is not parsed for markup, and is highlighted once when rendered).
+        """
+        config = self.config
+        if config.text_cells:
+            s = str(value)
+            return text_cell(s if max_len is None else _truncate(s, max_len))
+        s = _safe(value)
+        return s if max_len is None else _truncate(s, max_len)
+
+
+def _truncate_column(values: list[str], config: TableConfig) -> list[str]:
+    """Truncate all the values in a column, skipping the work when all the values are short."""
+    if not values or max(map(len, values)) < min(config.value_max_len, config.url_max_len):
+        return values
+    return [
+        _truncate(s, config.url_max_len if _is_url(s, config.url_prefixes) else config.value_max_len)
+        for s in values
+    ]
+
+
+def _create_columnar_table(data: ColumnarData, config: TableConfig) -> RichTable:
+    """Create a table from columnar data, converting each column in a batch."""
+    headers = [headerize(n) for n in data.names]
+    caption = config.items_caption.format(len(data))
     table = RichTable(
-        *headers, outer=True, show_lines=True, row_props=config.row_properties
+        *headers, outer=True, show_lines=True, caption=caption, row_props=config.row_properties
     )
-    for item in items:
-        values = []
-        for c in columns:
-            if c == WILDCARD_COLUMN:
-                sub_value = {k: v for k, v in item.items() if k not in columns}
-                values.append(_table_cell_value(sub_value, config))
-                continue
-            values.append(_table_cell_value(item.get(c), config))
-        table.add_row(*values)
+    if config.text_cells:
+        cells = [
+            [text_cell(s) for s in _truncate_column(data.strings(i), config)]
+            for i in range(len(data.names))
+        ]
+    else:
+        cells = [
+            _truncate_column(escape_column(data.strings(i)), config)
+            for i in range(len(data.names))
+        ]
+    for row in zip(*cells):  # noqa: B905
+        table.add_row(*row)
 
     return table
 
 
-def rich_table_factory(
-    obj: Any,
-    config: Optional[TableConfig] = None,
-    columns: Optional[list[str]] = None,
-) -> RichTable:
-    """Create a RichTable (alias for rich.table.Table) from the object."""
-    config = config or TableConfig()
-    if isinstance(obj, dict):
-        return _create_object_table(obj, outer=True, config=config)
+def _create_table(obj: Any, config: TableConfig, columns: Optional[list[str]]) -> RichTable:
+    """Create the table for the object (see rich_table_factory)."""
+    if is_structured_array(obj):
+        obj = ColumnarData(obj)
+    if isinstance(obj, ColumnarData):
+        return _create_columnar_table(obj, config=config)
+
+    builder = TableBuilder(config, streaming=isinstance(obj, Iterator))
+    if is_record(obj):
+        return builder.build(builder.object_table(obj, outer=True))
 
-    if isinstance(obj, list) and obj and isinstance(obj[0], dict):
+    type_name = type(obj).__name__
+    first = NOTHING
+    if isinstance(obj, (list, Iterator)):
+        first, obj = peek(obj)
+
+    if first is not NOTHING and is_record(first):
         if columns:
-            return _create_list_columns_table(obj, columns=columns, config=config)
+            return builder.build(builder.list_columns_table(obj, columns=columns))
 
-        return _create_list_table(obj, outer=True, config=config)
+        return builder.build(builder.list_table(obj, outer=True))
 
-    # this is a list of "simple" properties
-    if (
-        isinstance(obj, list)
-        and obj
-        and all(
-            item is None or isinstance(item, (str, float, bool, int)) for item in obj
-        )
-    ):
-        caption = config.items_caption.format(len(obj))
+    # this is a list of "simple" properties (only the first item of an iterator is checked)
+    scalars = obj if isinstance(obj, list) else [first]
+    if first is not NOTHING and all(map(_is_scalar, scalars)):
         table = RichTable(
             config.items_label,
             outer=True,
             show_lines=True,
-            caption=caption,
             row_props=config.row_properties,
         )
-        for item in obj:
-            table.add_row(_table_cell_value(item, config))
-        return table
+        if not _is_summarized(obj, config):
+            # later items of an iterator may not be scalars, so their nested tables are filled
+            for item in obj:
+                table.add_row(builder.cell_value(item))
+            return builder.build(_add_caption(table, True, config))
+
+        # only the first items have rows, followed by a row describing the rest
+        for item in obj[:config.summary_items]:
+            table.add_row(builder.cell_value(item))
+        more = config.summary_more.format(len(obj) - table.row_count)
+        stats = _summary_stats(obj, config)
+        table.add_row(builder.text(more if stats is None else f"{more} ({stats})"))
+        table.caption = config.items_caption.format(len(obj))
+        return builder.build(table)
+
+    raise ValueError(f"Unable to create table for type {type_name}")
+
+
+def rich_table_factory(
+    obj: Any,
+    config: Optional[TableConfig] = None,
+    columns: Optional[list[str]] = None,
+    where: Optional[Where] = None,
+    fixed_widths: bool = False,
+) -> RichTable:
+    """Create a RichTable (alias for rich.table.Table) from the object.
+
+    Besides dictionaries, the object (or list items) may be a dataclass, NamedTuple, slotted
+    object, or have a `to_dict()` method -- the fields are read directly from the objects.
+    Columnar data (`ColumnarData`, or a NumPy structured array) creates a row for each index.
+    An iterator (e.g. from `read_json()`) is consumed one item at a time, with the layout chosen
+    from the first item.
+
+    Only the list items that match the `where` filter (see `compile_where()`) are included.
+
+    With `fixed_widths`, the column widths are computed from the cells, so Rich does not need to
+    measure every cell. This is used when the table is rendered right away, since rows added later
+    are clipped to those widths.
+    """
+    config = config or TableConfig()
+    if where is not None:
+        obj = apply_where(obj, where)
+    table = _create_table(obj, config, columns)
+    if fixed_widths:
+        # the widths are known from the (truncated) cell values, so Rich does not need to measure them
+        table.fix_column_widths()
+    return table
+
+
+def _estimate_width(obj: Any, config: TableConfig, depth: int = 0) -> int:
+    """Estimate the width of a cell from the truncation limits, without building anything."""
+    if depth > MAX_ESTIMATE_DEPTH:
+        return 0
+    if is_record(obj):
+        mapping = _record(obj)
+        if not mapping:
+            return 0
+        keys = max(min(len(str(k)), config.key_max_len) for k in mapping)
+        values = max(_estimate_width(v, config, depth + 1) for v in mapping.values())
+        return keys + values + INNER_COLUMN_PADDING * 2
+    if isinstance(obj, list) and obj:
+        if is_record(obj[0]):
+            width = max(_estimate_width(item, config, depth + 1) for item in obj[:ESTIMATE_SAMPLE])
+            return width + INNER_COLUMN_PADDING
+        # only the first items are needed to reach the limit
+        s = ", ".join(str(v) for v in obj[:config.value_max_len])
+        return min(len(s), config.value_max_len)
+    s = str(obj)
+    return min(len(s), config.url_max_len if _is_url(s, config.url_prefixes) else config.value_max_len)
+
+
+def _estimate_table_width(first: Any, columns: Optional[list[str]], config: TableConfig) -> int:
+    """Estimate the width of a list table from one of its records."""
+    record = _record(first)
+    if columns:
+        others = {k: v for k, v in record.items() if k not in columns}
+        widths = [
+            max(len(headerize(c)), _estimate_width(others if c == WILDCARD_COLUMN else record.get(c), config))
+            for c in columns
+        ]
+    else:
+        name_key = _get_name_key(record, config.key_fields)
+        if not name_key:
+            widths = [_estimate_width(record, config)]
+        else:
+            other_key = _get_other_key(record, name_key)
+            rest = record.get(other_key) if other_key else {k: v for k, v in record.items() if k != name_key}
+            widths = [min(len(str(record[name_key])), config.key_max_len), _estimate_width(rest, config)]
+    return sum(widths) + OUTER_COLUMN_PADDING * len(widths) + 1
+
+
+def _vertical_layout(
+    obj: Any, columns: Optional[list[str]], config: TableConfig, width: int
+) -> tuple[bool, Any]:
+    """Check whether a list of records is shown as a block per record (and get the object, which may be peeked)."""
+    if config.vertical is False or not isinstance(obj, (list, Iterator)):
+        return False, obj
+    first, obj = peek(obj)
+    if first is NOTHING or not is_record(first):
+        return False, obj
+    if config.vertical:
+        return True, obj
+    sample = obj[:ESTIMATE_SAMPLE] if isinstance(obj, list) else [first]
+    estimate = max(_estimate_table_width(item, columns, config) for item in sample if is_record(item))
+    return estimate > width, obj
+
+
+def _record_block(item: Any, columns: Optional[list[str]]) -> Any:
+    """Get the properties of the record shown in its block (in the order of the columns, when provided)."""
+    if not columns:
+        return item
+    record = _record(item)
+    block: dict[Any, Any] = {}
+    for c in columns:
+        if c == WILDCARD_COLUMN:
+            block.update((k, v) for k, v in record.items() if k not in columns)
+        else:
+            block[c] = record.get(c)
+    return block
+
+
+class VerticalWriter:
+    """Prints a table for each record as it is read, so no column widths are shared between records."""
+
+    def __init__(self, console: Console, columns: Optional[list[str]], config: TableConfig):
+        """Initialize the writer (nothing is printed until the first record)."""
+        self.console = console
+        self.columns = columns
+        self.config = config
+        self.count = 0
+
+    def write(self, item: Any) -> None:
+        """Print the table for the record."""
+        block = _record_block(item, self.columns)
+        self.console.print(rich_table_factory(block, config=self.config, fixed_widths=True))
+        self.count += 1
+
+    def close(self) -> None:
+        """Print the number of records."""
+        self.console.print(self.config.items_caption.format(self.count))
+
+
+def _print_vertical(items: Iterable[Any], columns: Optional[list[str]], config: TableConfig, console: Console) -> None:
+    """Print a table for each record as it is read."""
+    writer = VerticalWriter(console, columns, config)
+    for item in items:
+        writer.write(item)
+    writer.close()
+    return
+
+
+def _renderable(obj: Any, columns: Optional[list[str]], config: Optional[TableConfig]) -> Any:
+    """Get what is displayed by the table format (e.g. the table, or message)."""
+    if isinstance(obj, str):
+        return _safe(obj)
+    if is_structured_array(obj):
+        obj = ColumnarData(obj)
+    if isinstance(obj, Iterator):
+        first, obj = peek(obj)
+        if first is NOTHING:
+            obj = None
+    if not obj:
+        return "Nothing found"
+    return rich_table_factory(obj, columns=columns, config=config, fixed_widths=True)
+
 
-    raise ValueError(f"Unable to create table for type {type(obj).__name__}")
+def _render(
+    obj: Any,
+    fmt: OutputFormat,
+    highlight: bool,
+    indent: int,
+    columns: Optional[list[str]],
+    console: Console,
+    config: Optional[TableConfig],
+) -> None:
+    """Render the object to the console (see display)."""
+    if fmt in EXPORTERS:
+        EXPORTERS[fmt](_renderable(obj, columns, config), console.file, console=console)
+        return
+
+    if isinstance(obj, str):
+        console.print(_safe(obj))
+        return
+
+    if is_structured_array(obj):
+        obj = ColumnarData(obj)
+
+    if fmt == OutputFormat.CSV:
+        write_csv(obj, console.file, columns=columns)
+        return
+
+    if fmt == OutputFormat.JSONL:
+        write_jsonl(obj, console.file)
+        return
+
+    if fmt == OutputFormat.TABLE:
+        vertical, obj = _vertical_layout(obj, columns, config or TableConfig(), console.width)
+        if vertical:
+            _print_vertical(obj, columns, config or TableConfig(), console)
+            return
+        console.print(_renderable(obj, columns, config))
+        return
+
+    # the JSON/YAML outputs need all the data, while tables are built one item at a time
+    if isinstance(obj, ColumnarData):
+        obj = list(obj.records())
+    elif isinstance(obj, Iterator):
+        obj = list(obj)
+
+    if fmt == OutputFormat.JSON:
+        console.print_json(data=obj, indent=indent, highlight=highlight, default=json_default)
+        return
+
+    console.print(_safe(yaml.dump(obj, indent=indent, Dumper=RecordDumper)))
+    return
+
+
+def _render_text(
+    obj: Any,
+    fmt: OutputFormat,
+    highlight: bool,
+    indent: int,
+    columns: Optional[list[str]],
+    console: Console,
+    config: Optional[TableConfig],
+) -> str:
+    """Render the object to a string (including any styles) rather than the console."""
+    if fmt in STREAMED_FORMATS:
+        # these write to the console file directly, so a copy of the console (with the same options)
+        # writes to the buffer -- the file of the console itself may be in use by other threads
+        buffer = io.StringIO()
+        buffered = copy.copy(console)
+        buffered.file = buffer
+        _render(obj, fmt, highlight, indent, columns, buffered, config)
+        return buffer.getvalue()
+
+    with console.capture() as capture:
+        _render(obj, fmt, highlight, indent, columns, console, config)
+    return capture.get()
+
+
+def _write_text(text: str, fmt: OutputFormat, console: Console) -> None:
+    """Write the rendered output in one write (the caller holds the lock).
+
+    The streamed formats are written to the console file, as they are when rendered directly. Other
+    output is printed through the console, so a capture, pager, or live display still gets it.
+    """
+    if fmt in STREAMED_FORMATS:
+        console.file.write(text)
+        console.file.flush()
+        return
+    if text:
+        console.print(Text.from_ansi(text), soft_wrap=True, end="\n" if text.endswith("\n") else "")
+    return
 
 
 def display(
@@ -238,39 +727,238 @@ def display(
     columns: Optional[list[str]] = None,
     console: Optional[Console] = None,
     config: Optional[TableConfig] = None,
+    cache: Optional[RenderCache] = None,
+    pager: bool = False,
+    where: Optional[Where] = None,
 ) -> None:
     """Display the data provided in obj, according to the formating arguments.
 
+    This can be called from multiple threads: the output is rendered by the calling thread, and
+    then written to the console in one (locked) write.
+
     Arguments:
-    obj: object to be displayed
-    fmt: controls the json/table/yaml output formatting (default=table)
+    obj: object to be displayed (e.g. dict, list, iterator, dataclass, or columnar data)
+    fmt: controls the json/table/yaml/csv/jsonl/html/svg output formatting (default=table)
     style: controls color/bold highlighting (default=all)
     indent: conroles number of indented spaces in json/yaml output (default=2)
     columns: used to control columns for a list of items, use a '*' as last argument to get remaining data.
     console: overrides default rich.Console, so you can provide additional highlighers.
     config: controls table parameters (e.g. labels, max-widths, row properties)
+    cache: re-uses the previously rendered output when the same data is displayed again (on the default console)
+    pager: shows the output a page at a time (when the console is a terminal)
+    where: only shows the list items that match, e.g. 'status != "ok"' (see compile_where)
 
     """
     no_color = style != OutputStyle.ALL
     highlight = style != OutputStyle.NONE
+    default_console = console is None
     console = console or console_factory(no_color=no_color, highlight=highlight)
+    if where is not None:
+        # iterators are filtered as they are read, so this does not read any items
+        obj = apply_where(obj, where)
+
+    if pager and console.is_terminal:
+        if fmt != OutputFormat.TABLE or isinstance(obj, str):
+            with console.pager():
+                _render(obj, fmt, highlight, indent, columns, console, config)
+            return
+        # imported here, since the pager builds its pages using this module
+        from rich_objects.pager import LazyPager  # noqa: PLC0415
+
+        LazyPager(obj, console=console, config=config, columns=columns).run()
+        return
 
-    if isinstance(obj, str):
-        console.print(_safe(obj))
+    vertical = False
+    if fmt == OutputFormat.TABLE:
+        # decided before building anything, since the blocks are printed as the records are read
+        vertical, obj = _vertical_layout(obj, columns, config or TableConfig(), console.width)
+
+    key = None
+    # only the default console is cached, since it is created from the style (while the output of
+    # other consoles depends on e.g. their theme and highlighter), and a Jupyter console needs the segments
+    if cache is not None and default_console and not isinstance(obj, (str, Iterator)) and not console.is_jupyter:
+        key = content_hash(
+            obj,
+            fmt,
+            style,
+            indent,
+            columns,
+            config or TableConfig(),
+            console.width,
+            console.color_system,
+            console.no_color,
+            console.is_terminal,
+        )
+    if key is not None:
+        text = cache.get(key)
+        if text is None:
+            text = _render_text(obj, fmt, highlight, indent, columns, console, config)
+            cache.put(key, text)
+    elif fmt in STREAMED_FORMATS or console.record or console.is_jupyter or vertical:
+        # written while the data is read (or the console needs the segments), so the lock is held throughout
+        with OUTPUT_LOCK:
+            _render(obj, fmt, highlight, indent, columns, console, config)
         return
+    else:
+        # rendered without the lock, so other threads can build their tables at the same time
+        text = _render_text(obj, fmt, highlight, indent, columns, console, config)
+
+    with OUTPUT_LOCK:
+        _write_text(text, fmt, console)
+    return
+
+
+def _target_console(destination: Destination, stack: ExitStack) -> Console:
+    """Get the console for an export destination (files opened for a path are closed by the stack)."""
+    if isinstance(destination, Console):
+        return destination
+    if isinstance(destination, (str, os.PathLike)):
+        destination = stack.enter_context(open(destination, "w", encoding="utf-8"))
+    return console_factory(file=destination)
 
+
+def _record_writer(fmt: OutputFormat, file: TextIO, indent: int, columns: Optional[list[str]]) -> RecordWriter:
+    """Create the writer for a record-oriented format."""
+    if fmt == OutputFormat.CSV:
+        return CsvWriter(file, columns=columns)
+    if fmt == OutputFormat.JSONL:
+        return JsonlWriter(file)
     if fmt == OutputFormat.JSON:
-        console.print_json(data=obj, indent=indent, highlight=highlight)
-        return
+        return JsonWriter(file, indent=indent)
+    return YamlWriter(file, indent=indent)
 
-    if fmt == OutputFormat.YAML:
-        console.print(_safe(yaml.dump(obj, indent=indent)))
-        return
 
-    if not obj:
-        console.print("Nothing found")
-        return
+def _feed(items: Iterable[Any], writers: list[RecordWriter]) -> Iterator[Any]:
+    """Pass each item to all the writers as it is read (e.g. while the table is built from it)."""
+    for item in items:
+        for writer in writers:
+            writer.write(item)
+        yield item
+
+
+def _write_object(obj: Any, fmt: OutputFormat, file: TextIO, indent: int, columns: Optional[list[str]]) -> None:
+    """Write an object (e.g. a record, or columnar data) in a record-oriented format."""
+    if fmt == OutputFormat.CSV:
+        write_csv(obj, file, columns=columns)
+    elif fmt == OutputFormat.JSONL:
+        write_jsonl(obj, file)
+    elif fmt == OutputFormat.JSON:
+        write_json(obj, file, indent=indent)
+    else:
+        write_yaml(obj, file, indent=indent)
+    return
 
-    table = rich_table_factory(obj, columns=columns, config=config)
-    console.print(table)
+
+def _split_vertical(
+    obj: Any, tables: list[tuple[OutputFormat, Console]], columns: Optional[list[str]], config: TableConfig
+) -> tuple[list[RecordWriter], Any, list[tuple[OutputFormat, Console]]]:
+    """Get the writers for the consoles that are too narrow (printing a table per record), and the other table targets.
+
+    The object is returned, since it may have been peeked.
+    """
+    writers: list[RecordWriter] = []
+    shared = []
+    for fmt, console in tables:
+        vertical = False
+        if fmt == OutputFormat.TABLE:
+            vertical, obj = _vertical_layout(obj, columns, config, console.width)
+        if vertical:
+            writers.append(VerticalWriter(console, columns, config))
+        else:
+            shared.append((fmt, console))
+    return writers, obj, shared
+
+
+def _export_items(
+    items: Iterable[Any],
+    writers: list[RecordWriter],
+    columns: Optional[list[str]],
+    config: TableConfig,
+    table: bool,
+) -> Any:
+    """Pass the items to the writers, building the table from them (when needed).
+
+    An iterator is read once, with each item passed to the writers while the table is built from it.
+    A list is already in memory, so the table is built from the list itself (as by display(), e.g.
+    keeping the summary of a long list), and the writers get the same items.
+    """
+    if isinstance(items, list):
+        for writer in writers:
+            if isinstance(writer, CsvWriter):
+                writer.start_list(items)
+        renderable = _renderable(items, columns, config) if table else None
+        fed = _feed(items, writers)
+    else:
+        fed = _feed(items, writers)
+        renderable = _renderable(fed, columns, config) if table else None
+    # read anything the table did not need, so every writer gets all the items
+    deque(fed, maxlen=0)
+    for writer in writers:
+        writer.close()
+    return renderable
+
+
+def export_targets(
+    obj: Any,
+    targets: Iterable[tuple[OutputFormat, Destination]],
+    indent: int = 2,
+    columns: Optional[list[str]] = None,
+    config: Optional[TableConfig] = None,
+    where: Optional[Where] = None,
+) -> None:
+    """Write the object in several formats, reading the items of a list (or iterator) once.
+
+    Each item is passed to the writer of every record-oriented format (CSV, JSON Lines, JSON, YAML)
+    while the table is built from it, and the table is built once for all the table formats (table,
+    HTML, SVG). So an iterator (e.g. from `read_json()`) is only read once, and nothing but the
+    table is kept in memory. The table is the one display() shows (e.g. a long list is summarized,
+    and a console that is too narrow gets a table per record), and the record formats are written
+    as plain text (without highlighting).
+
+    Example:
+        export_targets(read_json("response.json"), [
+            (OutputFormat.TABLE, console),
+            (OutputFormat.JSON, "response-archive.json"),
+            (OutputFormat.CSV, "response.csv"),
+        ])
+
+    Arguments:
+    obj: object to be written (e.g. dict, list, iterator, dataclass, or columnar data)
+    targets: format and destination pairs, where the destination is a console, text file, or path
+    indent: number of indented spaces in json/yaml output (default=2)
+    columns: used to control columns for a list of items, use a '*' as last argument to get remaining data.
+    config: controls table parameters (e.g. labels, max-widths, row properties)
+    where: only writes the list items that match, e.g. 'status != "ok"' (see compile_where)
+
+    """
+    config = config or TableConfig()
+    if where is not None:
+        obj = apply_where(obj, where)
+    if is_structured_array(obj):
+        obj = ColumnarData(obj)
+
+    # written while the data is read, so the lock is held throughout (as for the streamed formats)
+    with ExitStack() as stack, OUTPUT_LOCK:
+        outputs = [(OutputFormat(fmt), _target_console(destination, stack)) for fmt, destination in targets]
+        tables = [(fmt, console) for fmt, console in outputs if fmt in TABLE_FORMATS]
+        records = [(fmt, console) for fmt, console in outputs if fmt not in TABLE_FORMATS]
+
+        if isinstance(obj, (list, Iterator)):
+            writers = [_record_writer(fmt, console.file, indent, columns) for fmt, console in records]
+            vertical, obj, tables = _split_vertical(obj, tables, columns, config)
+            writers.extend(vertical)
+            renderable = _export_items(obj, writers, columns, config, bool(tables))
+        else:
+            # a single object (or columnar data, which each format writes a column at a time)
+            for fmt, console in records:
+                _write_object(obj, fmt, console.file, indent, columns)
+            renderable = _renderable(obj, columns, config) if tables else None
+
+        for fmt, console in tables:
+            if fmt in EXPORTERS:
+                EXPORTERS[fmt](renderable, console.file, console=console)
+            else:
+                console.print(renderable)
+        for _, console in outputs:
+            console.file.flush()
     return
@@ -8,6 +8,10 @@ class OutputFormat(str, Enum):
     TABLE = "table"
     JSON = "json"
     YAML = "yaml"
+    CSV = "csv"
+    JSONL = "jsonl"
+    HTML = "html"
+    SVG = "svg"
 
 
 class OutputStyle(str, Enum):
@@ -0,0 +1,321 @@
+"""Streaming HTML and SVG export, which writes the markup as the lines are rendered.
+
+`Console(record=True)` keeps every rendered segment until the export, so the memory used grows
+with the output. These functions produce the same markup as `Console.export_html` (with inline
+styles) and `Console.export_svg`, but only hold one line of segments at a time.
+"""
+import tempfile
+import zlib
+from collections.abc import Iterable
+from collections.abc import Iterator
+from html import escape
+from math import ceil
+from typing import Any
+from typing import Optional
+from typing import TextIO
+
+from rich.cells import cell_len
+from rich.color import blend_rgb
+from rich.console import CONSOLE_HTML_FORMAT
+from rich.console import CONSOLE_SVG_FORMAT
+from rich.console import Console
+from rich.console import RenderableType
+from rich.segment import Segment
+from rich.style import Style
+from rich.terminal_theme import DEFAULT_TERMINAL_THEME
+from rich.terminal_theme import SVG_EXPORT_THEME
+from rich.terminal_theme import TerminalTheme
+
+from rich_objects.console import console_factory
+from rich_objects.streaming import CHUNK_SIZE
+
+# stands in for the unique_id in the spooled SVG elements, since the default id depends on all the output
+# (NUL is not allowed in XML, so it cannot be part of the escaped text)
+UNIQUE_ID_MARKER = "\0"
+# sections of the SVG template that are written after the header
+SVG_SECTIONS = ("lines", "backgrounds", "matrix")
+
+# dimensions used by Rich's SVG template
+CHAR_HEIGHT = 20
+LINE_SPACING = 1.22
+MARGIN = 1
+PADDING_TOP = 40
+PADDING_SIDE = 8
+
+SVG_WINDOW_BUTTONS = """
+            <g transform="translate(26,22)">
+            <circle cx="0" cy="0" r="7" fill="#ff5f57"/>
+            <circle cx="22" cy="0" r="7" fill="#febc2e"/>
+            <circle cx="44" cy="0" r="7" fill="#28c840"/>
+            </g>
+        """
+
+
+def _segments(renderable: RenderableType, console: Console) -> Iterator[Segment]:
+    """Render the lines lazily, cropped to the console width (as `Console.print` records them)."""
+    if isinstance(renderable, str):
+        renderable = console.render_str(renderable)
+    lines = Segment.split_and_crop_lines(console.render(renderable), console.width, pad=False)
+    for line in lines:
+        yield from line
+
+
+def _split_format(code_format: str, field: str) -> tuple[str, str]:
+    """Split the template at the replacement field."""
+    marker = "{" + field + "}"
+    index = code_format.index(marker)
+    return code_format[:index], code_format[index + len(marker):]
+
+
+def export_html(
+    renderable: RenderableType,
+    file: TextIO,
+    console: Optional[Console] = None,
+    theme: Optional[TerminalTheme] = None,
+    code_format: str = CONSOLE_HTML_FORMAT,
+) -> None:
+    """Write the renderable to the file as HTML with inline styles.
+
+    Arguments:
+    renderable: table (or other renderable) to export
+    file: destination for the HTML
+    console: determines the width and options used to render (default=console_factory())
+    theme: terminal colors (default=Rich's default terminal theme)
+    code_format: HTML template, using '{code}', '{foreground}', '{background}', and '{stylesheet}'
+
+    """
+    console = console or console_factory()
+    theme = theme or DEFAULT_TERMINAL_THEME
+    colors = {
+        "stylesheet": "",
+        "foreground": theme.foreground_color.hex,
+        "background": theme.background_color.hex,
+    }
+    prefix, suffix = _split_format(code_format, "code")
+    file.write(prefix.format(**colors))
+    for text, style, _ in Segment.filter_control(Segment.simplify(_segments(renderable, console))):
+        markup = escape(text)
+        if style:
+            rule = style.get_html_style(theme)
+            if style.link:
+                markup = f'<a href="{style.link}">{markup}</a>'
+            markup = f'<span style="{rule}">{markup}</span>' if rule else markup
+        file.write(markup)
+    file.write(suffix.format(**colors))
+    return
+
+
+def _svg_text(text: str) -> str:
+    """Escape the text, with non-breaking spaces."""
+    return escape(text).replace(" ", "&#160;")
+
+
+def _svg_tag(name: str, content: Optional[str] = None, **attribs: Any) -> str:
+    """Make an SVG element (float values use the shortest representation)."""
+    values = " ".join(
+        f'{k.lstrip("_").replace("_", "-")}="{format(v, "g") if isinstance(v, float) else v}"'
+        for k, v in attribs.items()
+    )
+    return f"<{name} {values}>{content}</{name}>" if content else f"<{name} {values}/>"
+
+
+class _SvgStyles:
+    """CSS classes for the styles used in the SVG (in the order found)."""
+
+    def __init__(self, theme: TerminalTheme):
+        """Initialize with the terminal colors."""
+        self.theme = theme
+        self.classes: dict[str, int] = {}
+        self._rules: dict[Style, str] = {}
+
+    def rules(self, style: Style) -> str:
+        """Convert the style to CSS rules for SVG."""
+        css = self._rules.get(style)
+        if css is not None:
+            return css
+        theme = self.theme
+        default = style.color is None or style.color.is_default
+        color = theme.foreground_color if default else style.color.get_truecolor(theme)
+        default = style.bgcolor is None or style.bgcolor.is_default
+        bgcolor = theme.background_color if default else style.bgcolor.get_truecolor(theme)
+        if style.reverse:
+            color, bgcolor = bgcolor, color
+        if style.dim:
+            color = blend_rgb(color, bgcolor, 0.4)
+        rules = [f"fill: {color.hex}"]
+        if style.bold:
+            rules.append("font-weight: bold")
+        if style.italic:
+            rules.append("font-style: italic;")
+        if style.underline:
+            rules.append("text-decoration: underline;")
+        if style.strike:
+            rules.append("text-decoration: line-through;")
+        css = ";".join(rules)
+        self._rules[style] = css
+        return css
+
+    def class_name(self, style: Style) -> str:
+        """Get the class for the style."""
+        number = self.classes.setdefault(self.rules(style), len(self.classes) + 1)
+        return f"r{number}"
+
+    def background(self, style: Style) -> Optional[str]:
+        """Get the background color, when one is drawn for the style."""
+        theme = self.theme
+        if style.reverse:
+            return theme.foreground_color.hex if style.color is None else style.color.get_truecolor(theme).hex
+        if style.bgcolor is None or style.bgcolor.is_default:
+            return None
+        return style.bgcolor.get_truecolor(theme).hex
+
+
+def _copy(source: TextIO, file: TextIO, unique_id: str) -> None:
+    """Copy the spooled elements to the file, filling in the unique id."""
+    source.seek(0)
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        file.write(chunk.replace(UNIQUE_ID_MARKER, unique_id))
+
+
+def _write_clip_paths(file: TextIO, unique_id: str, count: int, width: float, line_height: float) -> None:
+    """Write the clip path for each line."""
+    for line_no in range(count):
+        if line_no:
+            file.write("\n")
+        rect = _svg_tag("rect", x=0, y=line_no * line_height + 1.5, width=width, height=line_height + 0.25)
+        file.write(f"""<clipPath id="{unique_id}-line-{line_no}">
+    {rect}
+            </clipPath>""")
+    return
+
+
+def export_svg(
+    renderable: RenderableType,
+    file: TextIO,
+    console: Optional[Console] = None,
+    title: str = "Rich",
+    theme: Optional[TerminalTheme] = None,
+    code_format: str = CONSOLE_SVG_FORMAT,
+    font_aspect_ratio: float = 0.61,
+    unique_id: Optional[str] = None,
+) -> None:
+    """Write the renderable to the file as an SVG image.
+
+    The size of the image is only known once all the lines are rendered, so the elements are
+    spooled to temporary files (rather than memory) until the header is written.
+
+    Arguments:
+    renderable: table (or other renderable) to export
+    file: destination for the SVG
+    console: determines the width and options used to render (default=console_factory())
+    title: title shown in the window chrome
+    theme: terminal colors (default=Rich's SVG export theme)
+    code_format: SVG template (see `rich.console.CONSOLE_SVG_FORMAT`)
+    font_aspect_ratio: width to height ratio of the font used in the template
+    unique_id: prefix for the CSS classes and element ids (default=computed from the content)
+
+    """
+    console = console or console_factory()
+    styles = _SvgStyles(theme or SVG_EXPORT_THEME)
+    width = console.width
+    char_width = CHAR_HEIGHT * font_aspect_ratio
+    line_height = CHAR_HEIGHT * LINE_SPACING
+
+    checksum = zlib.adler32(b"")
+    marker = unique_id if unique_id is not None else UNIQUE_ID_MARKER
+
+    def hashed(segments: Iterable[Segment]) -> Iterator[Segment]:
+        nonlocal checksum
+        for segment in segments:
+            checksum = zlib.adler32(repr(segment).encode("utf-8", "ignore"), checksum)
+            yield segment
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as backgrounds, \
+            tempfile.TemporaryFile("w+", encoding="utf-8") as matrix:
+        y = 0
+        segments = hashed(Segment.filter_control(_segments(renderable, console)))
+        for y, line in enumerate(Segment.split_and_crop_lines(segments, length=width)):
+            x = 0
+            for text, segment_style, _ in line:
+                style = segment_style or Style()
+                class_name = styles.class_name(style)
+                background = styles.background(style)
+                length = cell_len(text)
+                if background is not None:
+                    backgrounds.write(_svg_tag(
+                        "rect",
+                        fill=background,
+                        x=x * char_width,
+                        y=y * line_height + 1.5,
+                        width=char_width * length,
+                        height=line_height + 0.25,
+                        shape_rendering="crispEdges",
+                    ))
+                if text.strip(" "):
+                    matrix.write(_svg_tag(
+                        "text",
+                        _svg_text(text.replace(UNIQUE_ID_MARKER, "")),
+                        _class=f"{marker}-{class_name}",
+                        x=x * char_width,
+                        y=y * line_height + CHAR_HEIGHT,
+                        textLength=char_width * len(text),
+                        clip_path=f"url(#{marker}-line-{y})",
+                    ))
+                x += length
+
+        if unique_id is None:
+            unique_id = "terminal-" + str(zlib.adler32(title.encode("utf-8", "ignore"), checksum))
+
+        terminal_width = ceil(width * char_width + 2 * PADDING_SIDE)
+        terminal_height = (y + 1) * line_height + PADDING_TOP + PADDING_SIDE
+        chrome = _svg_tag(
+            "rect",
+            fill=styles.theme.background_color.hex,
+            stroke="rgba(255,255,255,0.35)",
+            stroke_width="1",
+            x=MARGIN,
+            y=MARGIN,
+            width=terminal_width,
+            height=terminal_height,
+            rx=8,
+        )
+        if title:
+            chrome += _svg_tag(
+                "text",
+                _svg_text(title),
+                _class=f"{unique_id}-title",
+                fill=styles.theme.foreground_color.hex,
+                text_anchor="middle",
+                x=terminal_width // 2,
+                y=MARGIN + CHAR_HEIGHT + 6,
+            )
+        chrome += SVG_WINDOW_BUTTONS
+
+        # fill in everything but the sections, which are written from the spooled files
+        svg = code_format.format(
+            unique_id=unique_id,
+            char_width=char_width,
+            char_height=CHAR_HEIGHT,
+            line_height=line_height,
+            terminal_width=char_width * width - 1,
+            terminal_height=(y + 1) * line_height - 1,
+            width=terminal_width + 2 * MARGIN,
+            height=terminal_height + 2 * MARGIN,
+            terminal_x=MARGIN + PADDING_SIDE,
+            terminal_y=MARGIN + PADDING_TOP,
+            styles="\n".join(f".{unique_id}-r{number} {{ {css} }}" for css, number in styles.classes.items()),
+            chrome=chrome,
+            **{name: UNIQUE_ID_MARKER + name + UNIQUE_ID_MARKER for name in SVG_SECTIONS},
+        )
+        for index, part in enumerate(svg.split(UNIQUE_ID_MARKER)):
+            if index % 2 == 0:
+                file.write(part)
+            elif part == "lines":
+                # Rich does not include a clip path for the last line
+                _write_clip_paths(file, unique_id, y, char_width * width, line_height)
+            else:
+                _copy(backgrounds if part == "backgrounds" else matrix, file, unique_id)
+    return
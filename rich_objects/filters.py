@@ -0,0 +1,196 @@
+"""Row filters (e.g. `status != "ok"`), compiled once and applied as the items are read."""
+import ast
+import operator
+from collections.abc import Iterator
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+from typing import Union
+
+from rich_objects.adapters import as_mapping
+from rich_objects.columnar import ColumnarData
+from rich_objects.columnar import RowView
+from rich_objects.columnar import is_structured_array
+
+Predicate = Callable[[Any], bool]
+# an expression, field values (or predicates), or a function of the item
+Where = Union[str, Mapping[str, Any], Predicate]
+
+# number of expressions with a cached predicate
+WHERE_CACHE_SIZE = 128
+
+COMPARISONS: dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+# a value, which is computed from the item
+Operand = Callable[[Any], Any]
+
+
+def _field(path: tuple[str, ...]) -> Operand:
+    """Create the accessor for a (nested) field, which is None when missing."""
+    if len(path) == 1:
+        name = path[0]
+
+        def get(item: Any) -> Any:
+            mapping = item if isinstance(item, dict) else as_mapping(item)
+            return None if mapping is None else mapping.get(name)
+
+        return get
+
+    def get_path(item: Any) -> Any:
+        for name in path:
+            mapping = item if isinstance(item, dict) else as_mapping(item)
+            if mapping is None:
+                return None
+            item = mapping.get(name)
+        return item
+
+    return get_path
+
+
+def _field_path(node: ast.expr) -> tuple[str, ...]:
+    """Get the field names of a name (e.g. `status`), or attribute (e.g. `spec.region`)."""
+    if isinstance(node, ast.Name):
+        return (node.id,)
+    if isinstance(node, ast.Attribute):
+        return (*_field_path(node.value), node.attr)
+    raise ValueError(f"Unsupported where expression: {ast.unparse(node)}")
+
+
+def _operand(node: ast.expr) -> Operand:
+    """Compile a field, or literal value."""
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        return _field(_field_path(node))
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, MemoryError, RecursionError):
+        # e.g. a name that is not a literal, or an unhashable set item
+        raise ValueError(f"Unsupported where expression: {ast.unparse(node)}") from None
+    if isinstance(value, set):
+        value = frozenset(value)
+    return lambda _: value
+
+
+def _compare(left: Operand, compare: Callable[[Any, Any], bool], right: Operand) -> Predicate:
+    """Compile a single comparison, which is False for values that cannot be compared (e.g. None < 1)."""
+
+    def predicate(item: Any) -> bool:
+        try:
+            return bool(compare(left(item), right(item)))
+        except TypeError:
+            return False
+
+    return predicate
+
+
+def _compile(node: ast.expr) -> Predicate:
+    """Compile the expression node to a predicate."""
+    if isinstance(node, ast.BoolOp):
+        predicates = [_compile(v) for v in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda item: all(p(item) for p in predicates)
+        return lambda item: any(p(item) for p in predicates)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        inner = _compile(node.operand)
+        return lambda item: not inner(item)
+    if isinstance(node, ast.Compare):
+        operands = [_operand(node.left), *map(_operand, node.comparators)]
+        predicates = []
+        for index, op in enumerate(node.ops):
+            compare = COMPARISONS.get(type(op))
+            if compare is None:
+                raise ValueError(f"Unsupported where expression: {ast.unparse(node)}")
+            predicates.append(_compare(operands[index], compare, operands[index + 1]))
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda item: all(p(item) for p in predicates)
+    # a field (or literal) on its own is checked for truth
+    operand = _operand(node)
+    return lambda item: bool(operand(item))
+
+
+@lru_cache(maxsize=WHERE_CACHE_SIZE)
+def _compile_expression(expression: str) -> Predicate:
+    """Parse and compile the expression (cached, since the same filters are used repeatedly)."""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except (SyntaxError, MemoryError, RecursionError) as ex:
+        raise ValueError(f"Invalid where expression: {expression}") from ex
+    return _compile(tree.body)
+
+
+def _value_predicate(name: str, expected: Any) -> Predicate:
+    """Compile the check for a single field of the mapping form."""
+    get = _field(tuple(name.split(".")))
+    if callable(expected):
+        return lambda item: bool(expected(get(item)))
+    if isinstance(expected, (set, frozenset, list, tuple)):
+        # lists are converted, so the membership check is fast (when the values are hashable)
+        try:
+            allowed: Any = frozenset(expected)
+        except TypeError:
+            allowed = expected
+        return _compare(get, COMPARISONS[ast.In], lambda _: allowed)
+    return lambda item: get(item) == expected
+
+
+def compile_where(where: Where) -> Predicate:
+    """Compile the filter to a predicate, which checks an item.
+
+    The filter may be:
+    * an expression, using field names (e.g. `status != "ok" and region in {"us", "eu"}`), with the
+      comparison (including `in`/`not in`), `and`/`or`/`not` operators, and literal values -- nested
+      fields use a dot (e.g. `spec.region`), and missing fields are None
+    * a mapping of field name to value, where a set (or list) matches any of the values, and a
+      function is called with the field value (e.g. `{"status": "ok", "count": lambda c: c > 1}`)
+    * a function, which is called with each item
+
+    Expressions are not evaluated as Python code, and the field accessors are created once.
+    """
+    if isinstance(where, str):
+        return _compile_expression(where)
+    if isinstance(where, Mapping):
+        predicates = [_value_predicate(str(k), v) for k, v in where.items()]
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda item: all(p(item) for p in predicates)
+    if callable(where):
+        return where
+    raise ValueError(f"Unsupported where filter of type {type(where).__name__}")
+
+
+def apply_where(obj: Any, where: Where) -> Any:
+    """Get the items of the object that match the filter.
+
+    Lists are filtered up front, and iterators are filtered as they are read, so the excluded items
+    never reach the table (or other output). The rows of columnar data are checked using a `RowView`
+    (which a function filter should not keep). Other objects (e.g. a single record) are not filtered.
+    """
+    predicate = compile_where(where)
+    if is_structured_array(obj):
+        obj = ColumnarData(obj)
+    if isinstance(obj, ColumnarData):
+        # each row is checked through the same view (rather than a dictionary per row)
+        row = RowView(obj)
+        indices = []
+        for index in range(len(obj)):
+            row.index = index
+            if predicate(row):
+                indices.append(index)
+        return obj.select(indices)
+    if isinstance(obj, list):
+        return [item for item in obj if predicate(item)]
+    if isinstance(obj, Iterator):
+        return filter(predicate, obj)
+    return obj
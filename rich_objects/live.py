@@ -0,0 +1,108 @@
+"""Live display of successive snapshots, only rebuilding the rows that changed."""
+from collections.abc import Iterable
+from typing import Any
+from typing import Optional
+
+from rich.console import Console
+from rich.live import Live
+
+from rich_objects.adapters import as_mapping
+from rich_objects.console import console_factory
+from rich_objects.display import TableBuilder
+from rich_objects.display import rich_table_factory
+from rich_objects.render_cache import content_hash
+from rich_objects.rich_table import RichTable
+from rich_objects.table_config import TableConfig
+
+
+class LiveDisplay:
+    """Displays successive snapshots of a list of records using `rich.live.Live`.
+
+    Records are matched between snapshots using the name key (e.g. `name` or `id`). Only the rows
+    for records that were added or changed are rebuilt, and the cells of the other rows are reused.
+
+    Example:
+        with LiveDisplay() as live:
+            while True:
+                live.update(client.list_items())
+                time.sleep(5)
+
+    """
+
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        config: Optional[TableConfig] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the display (additional keyword arguments are passed to `Live`)."""
+        self.config = config or TableConfig()
+        self.console = console or console_factory()
+        self.live = Live(console=self.console, auto_refresh=kwargs.pop("auto_refresh", False), **kwargs)
+        # number of rows that were rebuilt by the last snapshot
+        self.rebuilt = 0
+        self._layout: Optional[tuple[list[str], Optional[str], Optional[str]]] = None
+        self._rows: dict[Any, tuple[Optional[str], list[Any]]] = {}
+
+    def __enter__(self) -> "LiveDisplay":
+        """Start the live display."""
+        self.live.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the live display."""
+        self.live.stop()
+
+    def _row_key(self, item: Any, name_key: Optional[str], index: int, seen: set[Any]) -> Any:
+        """Get the identity of the item (falling back to position when missing, or duplicated)."""
+        mapping = as_mapping(item) if name_key else None
+        # the name may not be hashable (e.g. a list), so use the displayed value
+        key = (str(mapping.get(name_key)), 0) if mapping is not None and name_key in mapping else (None, index)
+        while key in seen:
+            key = (key[0], key[1] + 1)
+        seen.add(key)
+        return key
+
+    def table(self, items: Iterable[Any]) -> RichTable:
+        """Create the table for the snapshot, reusing the cells for rows that did not change."""
+        items = list(items)
+        self.rebuilt = 0
+        if items and as_mapping(items[0]) is None:
+            # not a list of records, so there are no rows to match up
+            self._layout = None
+            self._rows = {}
+            self.rebuilt = len(items)
+            return rich_table_factory(items, config=self.config, fixed_widths=True)
+
+        builder = TableBuilder(self.config)
+        layout, _ = builder.layout(items if items else [{}])
+        if layout != self._layout:
+            self._layout = layout
+            self._rows = {}
+        fields, name_key, other_key = layout
+
+        rows: dict[Any, tuple[Optional[str], list[Any]]] = {}
+        seen: set[Any] = set()
+        for index, item in enumerate(items):
+            key = self._row_key(item, name_key, index, seen)
+            digest = content_hash(item)
+            previous = self._rows.get(key)
+            if digest is not None and previous is not None and previous[0] == digest:
+                rows[key] = previous
+                continue
+            rows[key] = (digest, builder.list_row(item, name_key, other_key))
+            self.rebuilt += 1
+        builder.fill()
+        self._rows = rows
+
+        config = self.config
+        table = RichTable(*fields, outer=True, show_lines=True, row_props=config.row_properties)
+        for _, cells in rows.values():
+            table.add_row(*cells)
+        table.caption = config.items_caption.format(table.row_count)
+        table.fix_column_widths()
+        return table
+
+    def update(self, items: Iterable[Any]) -> None:
+        """Display the snapshot."""
+        self.live.update(self.table(items), refresh=True)
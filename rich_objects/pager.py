@@ -0,0 +1,209 @@
+"""Interactive pager that only builds and renders the pages that are viewed."""
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+
+from rich.console import Console
+
+from rich_objects.columnar import ColumnarData
+from rich_objects.columnar import is_structured_array
+from rich_objects.console import console_factory
+from rich_objects.constants import PAGE_PROMPT
+from rich_objects.display import rich_table_factory
+from rich_objects.table_config import TableConfig
+
+# smallest page height used, regardless of the terminal size
+MIN_PAGE_HEIGHT = 5
+# lines used by the table header, bottom border, and caption
+TABLE_FRAME_LINES = 5
+# with show_lines, each row uses at least the row and the separator
+MIN_ROW_LINES = 2
+
+PREVIOUS_KEYS = ("b", "p")
+QUIT_KEYS = ("q",)
+
+
+class LazyPager:
+    """Pages through a list (or iterator) of items, building the table for one screen at a time.
+
+    Each page is a table of the items that fit on the screen (so the header is repeated), and the
+    items of an iterator are only read as the pages are viewed. The most recently viewed pages are
+    kept, so going back to them does not render them again.
+
+    Example:
+        LazyPager(read_json("items.json")).run()
+
+    """
+
+    def __init__(
+        self,
+        obj: Any,
+        console: Optional[Console] = None,
+        config: Optional[TableConfig] = None,
+        columns: Optional[list[str]] = None,
+        cache_pages: int = 16,
+    ):
+        """Initialize the pager (nothing is rendered until a page is requested)."""
+        self.console = console or console_factory()
+        self.config = config or TableConfig()
+        self.columns = columns
+        self.cache_pages = cache_pages
+        # number of pages that were rendered (including pages rendered again after leaving the cache)
+        self.rendered = 0
+
+        if is_structured_array(obj):
+            obj = ColumnarData(obj)
+        if isinstance(obj, ColumnarData):
+            obj = obj.records()
+        self._source: Iterator[Any] = obj if isinstance(obj, Iterator) else iter(())
+        # items read so far (None when the object is not a list, so it is a single table)
+        self._items: Optional[list[Any]] = obj if isinstance(obj, list) else [] if isinstance(obj, Iterator) else None
+        self._obj = obj
+        self._lines: Optional[list[str]] = None
+        self._cache: OrderedDict[int, str] = OrderedDict()
+        # index of the first item on each page found so far
+        self._starts = [0]
+        self._last: Optional[int] = None
+        self._guess = 0
+
+    @property
+    def height(self) -> int:
+        """Get the number of lines on a page (leaving room for the prompt)."""
+        return max(self.console.size.height - 1, MIN_PAGE_HEIGHT)
+
+    @property
+    def last_page(self) -> Optional[int]:
+        """Get the index of the last page (None until it is found)."""
+        return self._last
+
+    def _fetch(self, end: int) -> int:
+        """Read items from the source until there are end items (returns the number available)."""
+        items = self._items
+        while len(items) < end:
+            item = next(self._source, self)
+            if item is self:
+                break
+            items.append(item)
+        return min(end, len(items))
+
+    def _render(self, start: int, count: int) -> str:
+        """Render the table for count items, starting with the item at start."""
+        table = rich_table_factory(
+            self._items[start:start + count], config=self.config, columns=self.columns, fixed_widths=True
+        )
+        table.caption = self.config.page_caption.format(start + 1, start + count)
+        with self.console.capture() as capture:
+            self.console.print(table)
+        return capture.get()
+
+    def _layout(self, start: int) -> Optional[tuple[str, int]]:
+        """Find how many items fit on the page starting with the item at start (None when there are none).
+
+        The number of items on the previous page is the first guess, so usually only a couple of
+        tables are rendered for each page.
+        """
+        height = self.height
+        count = self._guess or max(1, (height - TABLE_FRAME_LINES) // MIN_ROW_LINES)
+        best: Optional[tuple[str, int]] = None
+        too_many: Optional[int] = None
+        while True:
+            available = self._fetch(start + count) - start
+            if available <= 0:
+                return best
+            count = min(count, available)
+            text = self._render(start, count)
+            lines = text.count("\n")
+            if lines <= height or count == 1:
+                # a single item is shown even if it does not fit
+                best = (text, count)
+                if available < count + 1 or lines + MIN_ROW_LINES > height:
+                    break
+                count += max(1, (height - lines) // MIN_ROW_LINES)
+            else:
+                too_many = count
+                count = max(1, min(count * height // lines, count - 1))
+            if too_many is not None and count >= too_many:
+                count = too_many - 1
+            if best is not None and count <= best[1]:
+                break
+        self._guess = best[1]
+        return best
+
+    def _static_page(self, number: int) -> Optional[str]:
+        """Get the page of a single table (e.g. an object), which is split into screens."""
+        if self._lines is None:
+            with self.console.capture() as capture:
+                self.console.print(
+                    rich_table_factory(self._obj, config=self.config, columns=self.columns, fixed_widths=True)
+                )
+            self._lines = capture.get().splitlines(keepends=True)
+            self.rendered += 1
+        height = self.height
+        pages = max(1, -(-len(self._lines) // height))
+        self._last = pages - 1
+        if number >= pages:
+            return None
+        return "".join(self._lines[number * height: (number + 1) * height])
+
+    def _page(self, number: int) -> Optional[str]:
+        """Render the page, finding the pages before it as needed."""
+        starts = self._starts
+        while len(starts) <= number:
+            # the start of the page is only known once the previous page is laid out
+            if self._page(len(starts) - 1) is None:
+                return None
+
+        start = starts[number]
+        if number + 1 < len(starts):
+            text = self._render(start, starts[number + 1] - start)
+        else:
+            page = self._layout(start)
+            if page is None:
+                self._last = max(number - 1, 0)
+                return None
+            text, count = page
+            starts.append(start + count)
+            if self._fetch(start + count + 1) == start + count:
+                self._last = number
+        self.rendered += 1
+        self._cache[number] = text
+        self._cache.move_to_end(number)
+        while len(self._cache) > self.cache_pages:
+            self._cache.popitem(last=False)
+        return text
+
+    def page(self, number: int) -> Optional[str]:
+        """Get the rendered page (None when past the last page)."""
+        text = self._cache.get(number)
+        if text is not None:
+            self._cache.move_to_end(number)
+            return text
+        if self._items is None:
+            return self._static_page(number)
+        if number == 0 and self._fetch(1) == 0:
+            return "Nothing found\n"
+        return self._page(number)
+
+    def run(self) -> None:
+        """Show the pages, moving forward (or back) based on the user input."""
+        number = 0
+        while True:
+            text = self.page(number)
+            if text is None:
+                return
+            self.console.clear()
+            self.console.file.write(text)
+            self.console.file.flush()
+            try:
+                answer = self.console.input(PAGE_PROMPT.format(number + 1)).strip().lower()
+            except EOFError:
+                return
+            if answer in QUIT_KEYS:
+                return
+            if answer in PREVIOUS_KEYS:
+                number = max(number - 1, 0)
+                continue
+            if number == self._last:
+                return
+            number += 1
@@ -0,0 +1,238 @@
+"""Cache of rendered output, so unchanged data is not rendered again (e.g. for periodic refreshes)."""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from rich_objects.adapters import as_mapping
+from rich_objects.columnar import ColumnarData
+
+CACHE_SUFFIX = ".render"
+
+
+# values that are written using repr() (which distinguishes e.g. 1, 1.0, True, and "1")
+_SCALARS = frozenset([str, int, float, bool, type(None)])
+
+# kinds of entries on the stack used to walk the object
+_VALUE = 0
+_TOKEN = 1
+_EXIT = 2
+
+
+def _converted(obj: Any) -> Any:
+    """Convert columnar data and arrays to lists (None for other objects)."""
+    if isinstance(obj, ColumnarData):
+        return {name: obj.values(i) for i, name in enumerate(obj.names)}
+    if hasattr(obj, "tolist"):
+        # e.g. NumPy arrays
+        return obj.tolist()
+    return None
+
+
+def _encode(obj: Any) -> str:
+    """Encode the contents of the object, including the type of each container (e.g. tuple vs list).
+
+    The object is walked using an explicit stack, so deeply nested objects do not hit the recursion
+    limit. Circular references raise a ValueError.
+    """
+    parts: list[str] = []
+    append = parts.append
+    active: set[int] = set()
+    stack: list[tuple[int, Any]] = [(_VALUE, obj)]
+    while stack:
+        kind, item = stack.pop()
+        if kind == _TOKEN:
+            append(item)
+            continue
+        if kind == _EXIT:
+            active.discard(item[0])
+            append(item[1])
+            continue
+
+        cls = type(item)
+        if cls in _SCALARS:
+            append(repr(item))
+            continue
+        mapping = item if cls is dict else None if cls is list else as_mapping(item)
+        if mapping is None and not isinstance(item, (list, tuple)):
+            converted = _converted(item)
+            if converted is None:
+                append(repr(item))
+            else:
+                # tables of columnar data differ from tables of the same dicts/lists
+                append(cls.__name__)
+                stack.append((_VALUE, converted))
+            continue
+
+        if id(item) in active:
+            raise ValueError("Circular reference")
+        active.add(id(item))
+        if mapping is not None:
+            append("{")
+            stack.append((_EXIT, (id(item), "}")))
+            for key, value in reversed(list(mapping.items())):
+                stack.append((_VALUE, value))
+                stack.append((_TOKEN, repr(key) + ":"))
+        else:
+            is_list = isinstance(item, list)
+            append("[" if is_list else "(")
+            stack.append((_EXIT, (id(item), "]" if is_list else ")")))
+            stack.extend((_VALUE, v) for v in reversed(item))
+    return ",".join(parts)
+
+
+def content_hash(obj: Any, *parts: Any) -> Optional[str]:
+    """Get a hash of the object contents, and the other parts (None when the object cannot be hashed).
+
+    The contents are encoded by walking the object (without rendering it), including the types of
+    the containers, since they are displayed differently (e.g. a tuple vs a list).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        digest.update(_encode(obj).encode("utf-8", "surrogatepass"))
+    except (TypeError, ValueError, RecursionError):
+        # e.g. circular references, or a value whose repr() fails
+        return None
+    digest.update(repr(parts).encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counts of cache lookups."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups found in either tier."""
+        total = self.lookups
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+
+class RenderCache:
+    """Rendered output, keyed by a content hash.
+
+    The most recently used entries are kept in memory. When a directory is provided, entries are
+    also written to disk (so they survive restarts), and the oldest files are removed when the
+    total size exceeds max_disk_bytes. The cache can be shared by threads (e.g. calling display()).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        directory: Union[str, os.PathLike, None] = None,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ):
+        """Initialize the cache, with an optional on-disk tier."""
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._directory = Path(directory) if directory is not None else None
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(p.stat().st_size for p in self._directory.glob(f"*{CACHE_SUFFIX}"))
+
+    def __len__(self) -> int:
+        """Get the number of entries in memory."""
+        return len(self._memory)
+
+    def _path(self, key: str) -> Path:
+        """Get the on-disk location for the key."""
+        return self._directory / f"{key}{CACHE_SUFFIX}"
+
+    def _remember(self, key: str, text: str) -> None:
+        """Add the entry to memory, evicting the least recently used entries."""
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the rendered output (or None when not cached)."""
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                return text
+
+            if self._directory is not None:
+                path = self._path(key)
+                try:
+                    text = path.read_bytes().decode("utf-8")
+                    os.utime(path)
+                except OSError:
+                    text = None
+                if text is not None:
+                    self._remember(key, text)
+                    self.stats.disk_hits += 1
+                    return text
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """Add the rendered output to the cache."""
+        with self._lock:
+            self._remember(key, text)
+            if self._directory is None:
+                return
+
+            path = self._path(key)
+            data = text.encode("utf-8")
+            try:
+                previous = path.stat().st_size if path.exists() else 0
+                path.write_bytes(data)
+            except OSError:
+                return
+            self._disk_bytes += len(data) - previous
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+            return
+
+    def _evict(self) -> None:
+        """Remove the least recently used files, until the disk tier is within its size limit."""
+        files = []
+        for path in self._directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        self._disk_bytes = sum(f[1] for f in files)
+        for _, size, path in sorted(files, key=lambda f: f[0]):
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._disk_bytes -= size
+        return
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            if self._directory is not None:
+                for path in self._directory.glob(f"*{CACHE_SUFFIX}"):
+                    path.unlink(missing_ok=True)
+                self._disk_bytes = 0
+            return
@@ -1,11 +1,87 @@
 """Contains the RichTable class."""
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
+from typing import Optional
 
 from rich.box import HEAVY_HEAD
+from rich.cells import cell_len
+from rich.console import Console
+from rich.console import ConsoleOptions
+from rich.console import RenderResult
+from rich.emoji import Emoji
+from rich.table import Column
 from rich.table import Table
+from rich.text import Text
 
 from rich_objects.constants import DEFAULT_ROW_PROPS
 
+# number of column/table definitions shared by inner tables
+TEMPLATE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _column_template(header: Any, row_props: tuple[tuple[str, Any], ...]) -> type:
+    """Get a Column subclass with the definition as class attributes (shared by all its instances)."""
+    # created by the table, so the column gets the table defaults (e.g. highlight)
+    prototype = RichTable(header, outer=False, row_props=dict(row_props)).columns[0]
+    shared = {k: v for k, v in vars(prototype).items() if k not in ("_cells", "_index")}
+    return type(Column.__name__, (Column,), shared)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _table_template(cls: type, show_lines: bool) -> type:
+    """Get a subclass of the table class with the inner table settings as class attributes."""
+    prototype = cls(outer=False, show_lines=show_lines)
+    shared = {k: v for k, v in vars(prototype).items() if k not in ("columns", "rows")}
+    return type(cls.__name__, (cls,), shared)
+
+
+def text_width(s: str) -> int:
+    """Get the displayed width of a (markup) string, using a fast path for plain ASCII."""
+    # ASCII without markup, or emoji codes (e.g. ":smile:"), is one cell per character
+    if s.isascii() and s.isprintable() and "[" not in s and s.count(":") <= 1:
+        return len(s)
+    return max(cell_len(line) for line in Text.from_markup(s).plain.split("\n"))
+
+
+class TextCell(Text):
+    """Text for a table cell, which is not parsed for markup (so it does not need escaping).
+
+    Rich parses markup in every `str` cell, so values are escaped first and scanned twice. The emoji
+    codes are replaced when created, and the highlighting is applied when rendered, by the console
+    (as Rich does for a `str` cell).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, plain: str):
+        """Initialize with the text to display."""
+        super().__init__(Emoji.replace(plain) if ":" in plain else plain)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        """Render the text, highlighted for the console."""
+        # the console decides whether to highlight, where the column provides the highlight option
+        highlighted = console.render_str(self.plain, highlight=options.highlight, markup=False, emoji=False)
+        self.spans = highlighted.spans
+        yield from super().__rich_console__(console, options)
+
+
+def text_cell(plain: str) -> TextCell:
+    """Create the cell for a value displayed as text (see TextCell)."""
+    return TextCell(plain)
+
+
+def _cell_width(cell: Any, widths: dict[int, Optional[int]]) -> Optional[int]:
+    """Get the width of a cell (None when it cannot be determined without Rich measuring it)."""
+    if isinstance(cell, str):
+        return text_width(cell)
+    if isinstance(cell, Table):
+        return widths.get(id(cell))
+    if isinstance(cell, Text):
+        return max(cell_len(line) for line in cell.plain.split("\n"))
+    return None
+
 
 class RichTable(Table):
     """Wrapper for the rich.Table to provide some methods for adding complex items."""
@@ -14,7 +90,7 @@ class RichTable(Table):
         self,
         *args: Any,
         outer: bool = True,
-        row_props: dict[str, Any] = DEFAULT_ROW_PROPS,
+        row_props: Mapping[str, Any] = DEFAULT_ROW_PROPS,
         **kwargs: Any,
     ):
         """Initialize the Table with a few defaults."""
@@ -37,4 +113,100 @@ class RichTable(Table):
         for name in args:
             self.add_column(name, **row_props)
 
+    @classmethod
+    def inner(
+        cls,
+        *headers: Any,
+        show_lines: bool = False,
+        row_props: Mapping[str, Any] = DEFAULT_ROW_PROPS,
+    ) -> "RichTable":
+        """Create an inner table (e.g. outer=False), sharing the settings with other inner tables.
+
+        The table and column settings are class attributes of cached templates, so each table only
+        allocates its rows and cells. The shared settings should not be modified in place (assigning
+        an attribute only changes this table).
+        """
+        try:
+            props = tuple(row_props.items())
+            columns = [_column_template(h, props) for h in headers]
+            table_cls = _table_template(cls, show_lines)
+        except TypeError:
+            # unhashable headers or properties cannot be shared
+            return cls(*headers, outer=False, show_lines=show_lines, row_props=row_props)
+
+        table = object.__new__(table_cls)
+        table.rows = []
+        table.columns = []
+        for index, column_cls in enumerate(columns):
+            column = object.__new__(column_cls)
+            column._cells = []
+            column._index = index
+            table.columns.append(column)
+        return table
+
+    def _column_width(self, column: Column, widths: dict[int, Optional[int]]) -> Optional[int]:
+        """Get the content width of a column (None when it cannot be determined)."""
+        if not column.no_wrap:
+            # wrapping columns need Rich to negotiate the width
+            return None
+        cells = list(column.cells)
+        if self.show_header:
+            cells.append(column.header)
+        if self.show_footer:
+            cells.append(column.footer)
+
+        width = 0
+        for cell in cells:
+            cell_width = _cell_width(cell, widths)
+            if cell_width is None:
+                return None
+            width = max(width, cell_width)
+        if column.max_width is not None:
+            width = min(width, column.max_width)
+        if column.min_width is not None:
+            width = max(width, column.min_width)
+        return width
+
+    def _fix_widths(self, widths: dict[int, Optional[int]]) -> Optional[int]:
+        """Fix the width of the columns in this table (nested table widths are provided)."""
+        total: Optional[int] = self._extra_width
+        for column in self.columns:
+            width = column.width
+            if width is None:
+                width = self._column_width(column, widths)
+                if width is None:
+                    total = None
+                    continue
+                column.width = width
+            if total is not None:
+                total += width + self._get_padding_width(column._index)
+        return total
+
+    def fix_column_widths(self) -> Optional[int]:
+        """Set fixed widths on the columns of this table, and all nested tables.
+
+        Rich measures every cell (recursively) for flexible columns, and repeats that while rendering.
+        The widths are computed here once, so Rich skips those passes. Nested tables are handled with an
+        explicit stack (rather than recursion), and columns that cannot be computed stay flexible.
+
+        Returns the total table width (or None, when any column is flexible).
+        """
+        widths: dict[int, Optional[int]] = {}
+        stack: list[tuple[Table, bool]] = [(self, False)]
+        while stack:
+            table, nested_done = stack.pop()
+            if id(table) in widths:
+                continue
+            if not nested_done:
+                stack.append((table, True))
+                stack.extend(
+                    (cell, False)
+                    for column in table.columns
+                    for cell in column._cells
+                    if isinstance(cell, RichTable) and id(cell) not in widths
+                )
+                continue
+            widths[id(table)] = table._fix_widths(widths)
+        return widths[id(self)]
+
 
@@ -0,0 +1,99 @@
+"""Inference of the layout for lists of records, when the items do not all have the same keys."""
+import itertools
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any
+from typing import Optional
+
+from rich_objects.adapters import as_mapping
+
+# number of key signatures with a cached schema
+SCHEMA_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Schema:
+    """Keys found in a list of records, how often each was found, and the table layout chosen from them."""
+
+    # all the keys, in the order found
+    keys: tuple[Any, ...]
+    # distinct key tuples of the items (in the order found)
+    signature: tuple[tuple[Any, ...], ...]
+    name_key: Optional[str]
+    other_key: Optional[str]
+    # number of items with each of the keys (in the same order), and the number of items read
+    frequencies: tuple[int, ...] = ()
+    count: int = 0
+
+    def frequency(self, key: Any) -> int:
+        """Get the number of items that have the key."""
+        try:
+            return self.frequencies[self.keys.index(key)]
+        except (ValueError, IndexError):
+            return 0
+
+
+def _shape(item: Any) -> tuple[Any, ...]:
+    """Get the keys of a record (empty for other items)."""
+    mapping = as_mapping(item)
+    return () if mapping is None else tuple(mapping.keys())
+
+
+def sample_items(items: Iterable[Any], size: Optional[int]) -> tuple[list[Any], Iterable[Any]]:
+    """Get the first items (all of them when size is None), and an iterable that still includes them.
+
+    Only the sampled items of an iterator are read (and kept in memory).
+    """
+    if isinstance(items, list):
+        return (items if size is None else items[:size]), items
+    iterator = iter(items)
+    sample = list(itertools.islice(iterator, size))
+    return sample, itertools.chain(sample, iterator)
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _schema(signature: tuple[tuple[Any, ...], ...], key_fields: tuple[str, ...]) -> Schema:
+    """Choose the layout for the key signature (without the frequencies, which depend on the items)."""
+    keys = tuple(dict.fromkeys(itertools.chain.from_iterable(signature)))
+    shapes = [set(s) for s in signature]
+    # prefer an identifier that every item has, then one that any item has
+    present = [str(k) for k in key_fields if str(k) in keys]
+    everywhere = [k for k in present if all(k in s for s in shapes)]
+    name_key = (everywhere or present or [None])[0]
+
+    other_key = None
+    if name_key is not None:
+        others = {frozenset(s - {name_key}) for s in shapes}
+        if len(others) == 1:
+            other = next(iter(others))
+            other_key = next(iter(other)) if len(other) == 1 else None
+    return Schema(keys=keys, signature=signature, name_key=name_key, other_key=other_key)
+
+
+def infer_schema(items: Iterable[Any], key_fields: Iterable[str]) -> Schema:
+    """Infer the schema of the records in a single pass.
+
+    The distinct key tuples (e.g. the response shape) are counted, and the layout is chosen from
+    them: the name key is the first key field found in every item (or any item, when none is in
+    all of them), and there is an "other" key when every item has the same single key besides it.
+    The key frequencies are added up from the counts of each key tuple.
+
+    The pass over the items is always needed to find the key tuples. The layout (e.g. merging the
+    keys, and choosing the name/other keys) is cached by the key signature, so lists with the same
+    shape only repeat that pass.
+    """
+    shapes = Counter(map(_shape, items))
+    layout = _schema(tuple(shapes), tuple(key_fields))
+    frequencies = dict.fromkeys(layout.keys, 0)
+    for shape, count in shapes.items():
+        for key in shape:
+            frequencies[key] += count
+    return replace(layout, frequencies=tuple(frequencies.values()), count=sum(shapes.values()))
+
+
+def schema_cache_info() -> Any:
+    """Get the hits/misses of the schema cache."""
+    return _schema.cache_info()
@@ -0,0 +1,207 @@
+"""Incremental reading of JSON (and JSON Lines) from files or stdin."""
+import codecs
+import itertools
+import json
+import mmap
+import os
+import re
+import sys
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+from typing import Union
+
+# number of bytes (or characters) read at a time
+CHUNK_SIZE = 64 * 1024
+
+# sentinel used when there are no items
+NOTHING: Any = object()
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STDIN = "-"
+
+
+def peek(items: Iterable[Any]) -> tuple[Any, Iterable[Any]]:
+    """Get the first item, and an iterable that still includes it (first is NOTHING when empty).
+
+    Lists are returned as-is, so peeking does not add any overhead to them.
+    """
+    if isinstance(items, list):
+        return (items[0] if items else NOTHING), items
+    iterator = iter(items)
+    first = next(iterator, NOTHING)
+    if first is NOTHING:
+        return NOTHING, iterator
+    return first, itertools.chain([first], iterator)
+
+
+def _decode(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode the UTF-8 chunks, allowing for characters split across chunk boundaries."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _read_chunks(file: Any) -> Iterator[Any]:
+    """Read the (text or binary) file a chunk at a time."""
+    while True:
+        chunk = file.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _path_chunks(path: Union[str, os.PathLike], use_mmap: bool) -> Iterator[str]:
+    """Read the file at path, using a memory-map when allowed (and possible)."""
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not use_mmap or size == 0:
+            yield from _decode(_read_chunks(file))
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from _decode(mapped[i: i + CHUNK_SIZE] for i in range(0, size, CHUNK_SIZE))
+    return
+
+
+def _text_chunks(source: Any, use_mmap: bool) -> Iterator[str]:
+    """Get the text from the source (path, STDIN, or file object) a chunk at a time."""
+    if isinstance(source, (str, os.PathLike)) and str(source) != STDIN:
+        return _path_chunks(source, use_mmap)
+
+    file = sys.stdin if isinstance(source, str) else source
+    chunks = _read_chunks(file)
+    first = next(chunks, "")
+    if isinstance(first, bytes):
+        return _decode(itertools.chain([first], chunks))
+    return itertools.chain([first], chunks)
+
+
+class _JsonStream:
+    """Parses JSON values from text chunks, keeping only the unparsed text in memory."""
+
+    def __init__(self, chunks: Iterator[str]):
+        """Initialize with an iterator of text chunks."""
+        self._chunks = chunks
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> None:
+        """Read more text, discarding parsed text.
+
+        At least the amount of unparsed text is read, so a large value is re-parsed a limited
+        number of times (rather than once per chunk).
+        """
+        pending = self._buffer[self._pos:]
+        parts = [pending]
+        needed = max(len(pending), CHUNK_SIZE)
+        size = 0
+        for chunk in self._chunks:
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= needed:
+                break
+        else:
+            self._eof = True
+        self._buffer = "".join(parts)
+        self._pos = 0
+
+    def next_char(self) -> str:
+        """Skip whitespace, and get the next character (empty at the end of the text)."""
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ""
+            self._fill()
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        """Create an error at the current position."""
+        return json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of the provided characters."""
+        char = self.next_char()
+        if not char or char not in chars:
+            expected = " or ".join(repr(c) for c in chars)
+            raise self.error(f"Expecting {expected}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Parse the next JSON value."""
+        self.next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # a value that ends with the buffer may be incomplete (e.g. a number)
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def elements(self) -> Iterator[Any]:
+        """Iterate over the elements of an array (the opening bracket was already consumed)."""
+        if self.next_char() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def array(self) -> Iterator[Any]:
+        """Iterate over the elements of an array, which must be the only value in the text."""
+        self.expect("[")
+        yield from self.elements()
+        if self.next_char():
+            raise self.error("Extra data")
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over a sequence of JSON values (e.g. JSON Lines)."""
+        while self.next_char():
+            yield self.value()
+
+
+def read_json(
+    source: Any = STDIN,
+    lines: Optional[bool] = None,
+    use_mmap: bool = True,
+) -> Any:
+    """Read JSON from the source (a path, "-" for stdin, or a file object) incrementally.
+
+    A top-level array is returned as an iterator that parses one element at a time, and JSON Lines
+    are returned as an iterator that parses one line at a time. Any other single JSON document is
+    returned as the parsed value. JSON Lines that start with an array are only read with lines=True
+    (otherwise the data after the first array is an error).
+
+    Arguments:
+    source: path to the file, "-" for stdin, or an open (text or binary) file object
+    lines: True for JSON Lines, False for a single JSON document, None to detect from the data
+    use_mmap: allows files to be read through a memory-map
+
+    """
+    stream = _JsonStream(_text_chunks(source, use_mmap))
+    if lines:
+        return stream.values()
+
+    if stream.next_char() == "[":
+        # the elements are read as they are used, so JSON Lines of arrays need lines=True
+        return stream.array()
+
+    value = stream.value()
+    if not stream.next_char():
+        return value
+    if lines is False:
+        raise stream.error("Extra data")
+
+    # more values follow the first one, so this is JSON Lines
+    return itertools.chain([value], stream.values())
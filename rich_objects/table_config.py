@@ -2,14 +2,22 @@
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
+from typing import Optional
 
+from rich_objects.constants import CIRCULAR
 from rich_objects.constants import DEFAULT_ROW_PROPS
 from rich_objects.constants import FOUND_ITEMS
 from rich_objects.constants import ITEMS
 from rich_objects.constants import KEY_FIELDS
 from rich_objects.constants import KEY_MAX_LEN
+from rich_objects.constants import PAGE_ITEMS
 from rich_objects.constants import PROPERTIES
 from rich_objects.constants import PROPERTY
+from rich_objects.constants import SCHEMA_SAMPLE
+from rich_objects.constants import SUMMARY_ITEMS
+from rich_objects.constants import SUMMARY_ITEMS_SHOWN
+from rich_objects.constants import SUMMARY_MORE
+from rich_objects.constants import SUMMARY_STATS
 from rich_objects.constants import UNKNOWN
 from rich_objects.constants import URL_MAX_LEN
 from rich_objects.constants import URL_PREFIXES
@@ -23,6 +31,20 @@ class TableConfig:
     """Configuration for customizing the table outputs.
 
     The defaults provide a standard look and feel, but can be overridden to all customization.
+    Each instance gets its own copy of the list/dict defaults, so changing one does not affect
+    other tables (or threads).
+
+    Lists of scalars with more than `summary_threshold` items are summarized (e.g. the count, the
+    first few items, and the min/max/mean of numbers), rather than showing every item.
+
+    The layout of a list of records is chosen from the first item, unless `infer_schema` is set:
+    then the keys of the first `schema_sample` items (or all, when None) are used.
+
+    When `display()` estimates that a list table is wider than the console, each record is shown as
+    a separate table instead (`vertical` set to True/False always/never does this).
+
+    With `text_cells`, values are added to the tables as highlighted `Text` (rather than escaped
+    markup), so Rich does not parse them again when rendering.
     """
 
     items_label: str = ITEMS
@@ -31,10 +53,21 @@ class TableConfig:
     value_label: str = VALUE
     values_label: str = VALUES
     unknown_label: str = UNKNOWN
+    circular_label: str = CIRCULAR
     items_caption: str = FOUND_ITEMS
-    url_prefixes: list[str] = field(default_factory=lambda: URL_PREFIXES)
+    page_caption: str = PAGE_ITEMS
+    url_prefixes: list[str] = field(default_factory=lambda: list(URL_PREFIXES))
     url_max_len: int = URL_MAX_LEN
-    key_fields: list[str] = field(default_factory=lambda: KEY_FIELDS)
+    key_fields: list[str] = field(default_factory=lambda: list(KEY_FIELDS))
     key_max_len: int = KEY_MAX_LEN
     value_max_len: int = VALUE_MAX_LEN
-    row_properties: dict[str, Any] = field(default_factory=lambda: DEFAULT_ROW_PROPS)
+    row_properties: dict[str, Any] = field(default_factory=lambda: dict(DEFAULT_ROW_PROPS))
+    summary_threshold: Optional[int] = None
+    summary_items: int = SUMMARY_ITEMS_SHOWN
+    summary_label: str = SUMMARY_ITEMS
+    summary_more: str = SUMMARY_MORE
+    stats_label: str = SUMMARY_STATS
+    infer_schema: bool = False
+    schema_sample: Optional[int] = SCHEMA_SAMPLE
+    vertical: Optional[bool] = None
+    text_cells: bool = False
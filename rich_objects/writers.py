@@ -0,0 +1,241 @@
+"""Writers for the record-oriented text formats (e.g. CSV, JSON Lines, JSON, YAML)."""
+import csv
+import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Optional
+from typing import TextIO
+
+import yaml
+
+from rich_objects.adapters import RecordDumper
+from rich_objects.adapters import as_mapping
+from rich_objects.adapters import json_default
+from rich_objects.columnar import ColumnarData
+from rich_objects.constants import ITEMS
+from rich_objects.constants import WILDCARD_COLUMN
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert nested values to JSON, so they survive in a single CSV cell."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return json.dumps(value, default=json_default)
+
+
+def _csv_fields(records: Iterable[Any], columns: Optional[list[str]]) -> list[Any]:
+    """Get the CSV header fields: the provided columns, or the keys of all the records (in order found)."""
+    keys: dict[Any, None] = {}
+    if not columns or WILDCARD_COLUMN in columns:
+        for item in records:
+            keys.update(dict.fromkeys(item.keys()))
+    if not columns:
+        return list(keys)
+
+    fields: list[Any] = []
+    for c in columns:
+        if c == WILDCARD_COLUMN:
+            fields.extend(k for k in keys if k not in columns)
+            continue
+        fields.append(c)
+    return fields
+
+
+def _as_records(obj: Any) -> Optional[list[Any]]:
+    """Get a list of mappings for a record, or list of records (otherwise, None)."""
+    mapping = as_mapping(obj)
+    if mapping is not None:
+        return [mapping]
+    if not isinstance(obj, list):
+        return None
+    records = [as_mapping(item) for item in obj]
+    if any(r is None for r in records):
+        return None
+    return records
+
+
+class CsvWriter:
+    """Writes the items as CSV one at a time (e.g. as they are read).
+
+    The fields are the keys of the first record (or the provided columns), unless the header is
+    started with all the records. Items that are not records are written as a single column (or
+    in the first column, after records).
+    """
+
+    def __init__(self, file: TextIO, columns: Optional[list[str]] = None):
+        """Initialize the writer (nothing is written until the header is started)."""
+        self._writer = csv.writer(file, lineterminator="\n")
+        self.columns = columns
+        self._fields: Optional[list[Any]] = None
+        self._started = False
+
+    def start(self, records: Optional[list[Any]]) -> None:
+        """Write the header for the records (None for a single column of items)."""
+        self._started = True
+        if records is None:
+            self._writer.writerow([ITEMS])
+            return
+        self._fields = _csv_fields(records, self.columns)
+        self._writer.writerow(self._fields)
+
+    def start_list(self, items: list[Any]) -> None:
+        """Write the header for a list, so the fields include the keys of every record."""
+        self.start(_as_records(items))
+
+    def write(self, item: Any) -> None:
+        """Write a row for the item."""
+        if not self._started:
+            mapping = as_mapping(item)
+            self.start(None if mapping is None else [mapping])
+        if self._fields is None:
+            self._writer.writerow([_csv_value(item)])
+            return
+        mapping = as_mapping(item)
+        if mapping is None:
+            # e.g. a value after the records of an iterator, which goes in the first column
+            self._writer.writerow([_csv_value(item)])
+            return
+        self._writer.writerow([_csv_value(mapping.get(f)) for f in self._fields])
+
+    def close(self) -> None:
+        """Finish the output (nothing to do for CSV)."""
+        return
+
+
+def write_csv(obj: Any, file: TextIO, columns: Optional[list[str]] = None) -> None:
+    """Write the object to the file as CSV.
+
+    For an iterator, the items are written as they are read, so the fields are determined by the
+    first item (when columns are not provided).
+    """
+    if isinstance(obj, ColumnarData):
+        writer = csv.writer(file, lineterminator="\n")
+        writer.writerow(obj.names)
+        writer.writerows(zip(*[obj.values(i) for i in range(len(obj.names))]))  # noqa: B905
+        return
+
+    csv_writer = CsvWriter(file, columns=columns)
+    if isinstance(obj, Iterator):
+        items: Iterable[Any] = obj
+    else:
+        # a list of "simple" properties is a single column
+        records = _as_records(obj)
+        csv_writer.start(records)
+        items = records if records is not None else obj if isinstance(obj, list) else [obj]
+    for item in items:
+        csv_writer.write(item)
+    return
+
+
+class JsonlWriter:
+    """Writes the items as JSON Lines one at a time."""
+
+    def __init__(self, file: TextIO):
+        """Initialize the writer."""
+        self.file = file
+
+    def write(self, item: Any) -> None:
+        """Write a line for the item."""
+        self.file.write(json.dumps(item, default=json_default) + "\n")
+
+    def close(self) -> None:
+        """Finish the output (nothing to do for JSON Lines)."""
+        return
+
+
+class JsonWriter:
+    """Writes the items as a JSON array one at a time (the same as dumping the list of items)."""
+
+    def __init__(self, file: TextIO, indent: int = 2):
+        """Initialize the writer (nothing is written until the first item)."""
+        self.file = file
+        self.indent = indent
+        self._prefix = " " * indent
+        self._count = 0
+
+    def write(self, item: Any) -> None:
+        """Write the item as the next element of the array."""
+        self.file.write(",\n" if self._count else "[\n")
+        text = json.dumps(item, indent=self.indent, default=json_default, ensure_ascii=False)
+        self.file.write(self._prefix + text.replace("\n", "\n" + self._prefix))
+        self._count += 1
+
+    def close(self) -> None:
+        """Finish the array."""
+        self.file.write("\n]\n" if self._count else "[]\n")
+
+
+class YamlWriter:
+    """Writes the items as a YAML list one at a time (the same as dumping the list of items)."""
+
+    def __init__(self, file: TextIO, indent: int = 2):
+        """Initialize the writer."""
+        self.file = file
+        self.indent = indent
+        self._count = 0
+
+    def write(self, item: Any) -> None:
+        """Write the item as the next element of the list."""
+        self.file.write(yaml.dump([item], indent=self.indent, Dumper=RecordDumper))
+        self._count += 1
+
+    def close(self) -> None:
+        """Finish the list (only needed when there were no items)."""
+        if not self._count:
+            self.file.write(yaml.dump([], indent=self.indent, Dumper=RecordDumper))
+
+
+def write_jsonl(obj: Any, file: TextIO) -> None:
+    """Write the object to the file as JSON Lines (e.g. one JSON value per line)."""
+    if isinstance(obj, ColumnarData):
+        # encode each column in a batch, and assemble the lines without creating row dictionaries
+        prefixes = [json.dumps(n) + ": " for n in obj.names]
+        encoded = [
+            [p + json.dumps(v, default=json_default) for v in obj.values(i)]
+            for i, p in enumerate(prefixes)
+        ]
+        for row in zip(*encoded):  # noqa: B905
+            file.write("{" + ", ".join(row) + "}\n")
+        return
+
+    writer = JsonlWriter(file)
+    items = obj if isinstance(obj, (list, Iterator)) else [obj]
+    for item in items:
+        writer.write(item)
+    return
+
+
+def _items(obj: Any) -> Optional[Iterable[Any]]:
+    """Get the items of a list, iterator, or columnar data (None for other objects)."""
+    if isinstance(obj, ColumnarData):
+        return obj.records()
+    if isinstance(obj, (list, Iterator)):
+        return obj
+    return None
+
+
+def write_json(obj: Any, file: TextIO, indent: int = 2) -> None:
+    """Write the object to the file as JSON (the items of an iterator are written as they are read)."""
+    items = _items(obj)
+    if items is None:
+        file.write(json.dumps(obj, indent=indent, default=json_default, ensure_ascii=False) + "\n")
+        return
+    writer = JsonWriter(file, indent=indent)
+    for item in items:
+        writer.write(item)
+    writer.close()
+    return
+
+
+def write_yaml(obj: Any, file: TextIO, indent: int = 2) -> None:
+    """Write the object to the file as YAML (the items of an iterator are written as they are read)."""
+    items = _items(obj)
+    if items is None:
+        file.write(yaml.dump(obj, indent=indent, Dumper=RecordDumper))
+        return
+    writer = YamlWriter(file, indent=indent)
+    for item in items:
+        writer.write(item)
+    writer.close()
+    return
@@ -0,0 +1,167 @@
+import io
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+from typing import Optional
+from unittest import mock
+
+import pytest
+import yaml
+
+from rich_objects.adapters import ObjectView
+from rich_objects.adapters import as_mapping
+from rich_objects.adapters import is_record
+from rich_objects.adapters import record_fields
+from rich_objects.display import display
+from rich_objects.display import rich_table_factory
+from rich_objects.enums import OutputFormat
+from rich_objects.enums import OutputStyle
+from rich_objects.writers import write_yaml
+from tests.helpers import StringIo
+
+
+@dataclass
+class Inner:
+    a: int
+    b: int
+
+
+@dataclass
+class Item:
+    name: str
+    data: Optional[Inner] = None
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Slotted:
+    __slots__ = ("_hidden", "id", "value")
+
+    def __init__(self, id: int, value: str):  # noqa: A002
+        self._hidden = "secret"
+        self.id = id
+        self.value = value
+
+
+class Convertible:
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_dict(self):
+        return {"name": self.name, "kind": "converted"}
+
+
+@pytest.mark.parametrize(
+    ["cls", "expected"],
+    [
+        pytest.param(Item, ("name", "data"), id="dataclass"),
+        pytest.param(Point, ("x", "y"), id="namedtuple"),
+        pytest.param(Slotted, ("id", "value"), id="slots"),
+        pytest.param(Convertible, None, id="to_dict"),
+        pytest.param(Path, None, id="private-slots"),
+        pytest.param(uuid.UUID, None, id="stdlib-slots"),
+        pytest.param(str, None, id="str"),
+    ]
+)
+def test_record_fields(cls, expected):
+    assert record_fields(cls) == expected
+
+
+def test_record_fields_cached():
+    record_fields.cache_clear()
+    record_fields(Item)
+    record_fields(Item)
+    info = record_fields.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_object_view():
+    item = Item("sna", Inner(1, 2))
+    uut = as_mapping(item)
+    assert isinstance(uut, ObjectView)
+    assert list(uut) == ["name", "data"]
+    assert len(uut) == 2
+    assert "name" in uut
+    assert uut["data"] is item.data
+    with pytest.raises(KeyError):
+        uut["missing"]
+
+
+@pytest.mark.parametrize(
+    ["obj", "expected"],
+    [
+        pytest.param({"a": 1}, True, id="dict"),
+        pytest.param(Item("a"), True, id="dataclass"),
+        pytest.param(Point(1, 2), True, id="namedtuple"),
+        pytest.param(Slotted(1, "a"), True, id="slots"),
+        pytest.param(Convertible("a"), True, id="to_dict"),
+        pytest.param("abc", False, id="str"),
+        pytest.param(None, False, id="none"),
+        pytest.param([1, 2], False, id="list"),
+        pytest.param(Path("/tmp"), False, id="path"),
+        pytest.param(uuid.UUID(int=5), False, id="uuid"),
+    ]
+)
+def test_is_record(obj, expected):
+    assert is_record(obj) == expected
+
+
+def test_table_dataclass_list():
+    items = [Item("sna", Inner(1, 2)), Item("foo")]
+    uut = rich_table_factory(items)
+    assert len(uut.columns) == 2
+    assert uut.row_count == 2
+    assert uut.columns[1].header == "Data"
+    assert uut.columns[0]._cells == ["sna", "foo"]
+    inner = uut.columns[1]._cells[0]
+    assert inner.columns[0]._cells == ["a", "b"]
+    assert inner.columns[1]._cells == ["1", "2"]
+    assert uut.columns[1]._cells[1] == "None"
+
+    # the objects are not modified
+    assert items[0].name == "sna"
+
+
+def test_table_records():
+    uut = rich_table_factory(Point(3, 4))
+    assert uut.columns[0]._cells == ["x", "y"]
+    assert uut.columns[1]._cells == ["3", "4"]
+
+    uut = rich_table_factory([Slotted(1, "a"), Slotted(2, "b")])
+    assert uut.columns[0].header == "Id"
+    assert uut.columns[1].header == "Value"
+    assert uut.columns[1]._cells == ["a", "b"]
+
+    uut = rich_table_factory([Convertible("sna")])
+    assert uut.columns[0]._cells == ["sna"]
+    assert uut.columns[1]._cells == ["converted"]
+
+
+def test_table_uuid_values():
+    value = uuid.UUID(int=5)
+    uut = rich_table_factory({"id": value, "items": [{"name": "a", "id": value}]})
+    assert uut.columns[1]._cells[0] == str(value)
+    inner = uut.columns[1]._cells[1]
+    assert inner.columns[1]._cells == [str(value)]
+
+
+def test_yaml_records():
+    items = [Item("sna", Inner(1, 2)), {"point": Point(3, 4), "slotted": Slotted(1, "a")}]
+    expected = [
+        {"name": "sna", "data": {"a": 1, "b": 2}},
+        {"point": {"x": 3, "y": 4}, "slotted": {"id": 1, "value": "a"}},
+    ]
+    with mock.patch("sys.stdout", new_callable=StringIo) as mock_stdout:
+        display(items, OutputFormat.YAML, OutputStyle.NONE)
+        text = mock_stdout.getvalue()
+    assert "!!python" not in text
+    assert yaml.safe_load(text) == expected
+
+    out = io.StringIO()
+    write_yaml(iter(items), out)
+    assert yaml.safe_load(out.getvalue()) == expected
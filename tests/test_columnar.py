@@ -0,0 +1,134 @@
+import json
+from unittest import mock
+
+import pytest
+
+from rich_objects.columnar import ColumnarData
+from rich_objects.columnar import RowView
+from rich_objects.columnar import escape_column
+from rich_objects.display import display
+from rich_objects.display import rich_table_factory
+from rich_objects.enums import OutputFormat
+from rich_objects.enums import OutputStyle
+from rich_objects.table_config import TableConfig
+from tests.helpers import StringIo
+
+COLUMNS = {
+    "name": ["sna", "foo", "bar"],
+    "count": [1, 2, None],
+    "note": ["[red]hot[/]", "x" * 60, "https://example.com/" + "y" * 40],
+}
+
+
+def test_columnar_data():
+    uut = ColumnarData(COLUMNS)
+    assert len(uut) == 3
+    assert uut.names == ["name", "count", "note"]
+    assert uut.strings(1) == ["1", "2", "None"]
+    assert list(uut.records())[0] == {"name": "sna", "count": 1, "note": "[red]hot[/]"}
+
+
+def test_columnar_data_errors():
+    with pytest.raises(ValueError) as excinfo:
+        ColumnarData({"a": [1, 2], "b": [1]})
+    assert excinfo.match("Columns have different lengths")
+
+    with pytest.raises(ValueError) as excinfo:
+        ColumnarData([1, 2])
+    assert excinfo.match("Unable to create columns for type list")
+
+
+def test_row_view():
+    uut = RowView(ColumnarData(COLUMNS), index=1)
+    assert list(uut) == ["name", "count", "note"]
+    assert len(uut) == 3
+    assert uut["name"] == "foo"
+    assert "count" in uut
+    assert uut.get("missing") is None
+    uut.index = 2
+    assert dict(uut) == {name: values[2] for name, values in COLUMNS.items()}
+
+
+def test_escape_column():
+    values = ["abc", "def"]
+    assert escape_column(values) is values
+    assert escape_column(["[b]"]) == ["\\[b]"]
+
+
+def test_columnar_table():
+    uut = rich_table_factory(ColumnarData(COLUMNS))
+    assert uut.row_count == 3
+    assert [c.header for c in uut.columns] == ["Name", "Count", "Note"]
+    assert uut.caption == "Found 3 items"
+    assert uut.columns[1]._cells == ["1", "2", "None"]
+    note = uut.columns[2]._cells
+    assert note[0] == "\\[red]hot\\[/]"
+    assert note[1] == "x" * 47 + "..."
+    assert note[2] == COLUMNS["note"][2]
+
+
+def test_columnar_table_config():
+    config = TableConfig(value_max_len=5, url_max_len=10)
+    uut = rich_table_factory(ColumnarData(COLUMNS), config)
+    assert uut.columns[0]._cells == ["sna", "foo", "bar"]
+    assert uut.columns[2]._cells[2] == "https:/..."
+
+    # URLs are truncated even when shorter than the value limit
+    config = TableConfig(url_max_len=20)
+    uut = rich_table_factory(ColumnarData({"url": ["https://example.com/some/long/path"]}), config)
+    record = rich_table_factory([{"url": "https://example.com/some/long/path"}], config)
+    assert uut.columns[0]._cells == ["https://example.c..."]
+    assert record.columns[0]._cells[0].columns[1]._cells == uut.columns[0]._cells
+
+
+def test_columnar_text_cells():
+    uut = rich_table_factory(ColumnarData(COLUMNS), TableConfig(text_cells=True))
+    note = [cell.plain for cell in uut.columns[2]._cells]
+    assert note[0] == "[red]hot[/]"
+    assert note[1] == "x" * 47 + "..."
+    # highlighted when rendered (using the console highlighter)
+    assert uut.columns[1]._cells[0].spans == []
+
+
+def test_columnar_csv():
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(ColumnarData(COLUMNS), OutputFormat.CSV, OutputStyle.NONE)
+        lines = mock_stdout.getvalue().splitlines()
+    assert lines[0] == "name,count,note"
+    assert lines[1] == "sna,1,[red]hot[/]"
+    assert lines[3].startswith("bar,,https://")
+
+
+def test_columnar_jsonl():
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(ColumnarData(COLUMNS), OutputFormat.JSONL, OutputStyle.NONE)
+        lines = mock_stdout.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == list(ColumnarData(COLUMNS).records())
+
+
+def test_columnar_json():
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(ColumnarData({"a": [1, 2]}), OutputFormat.JSON, OutputStyle.NONE)
+        output = mock_stdout.getvalue()
+    assert json.loads(output) == [{"a": 1}, {"a": 2}]
+
+
+def test_numpy_structured_array():
+    np = pytest.importorskip("numpy")
+    data = np.array([(1, 2.5), (2, 3.0)], dtype=[("id", "i4"), ("value", "f8")])
+
+    uut = rich_table_factory(data)
+    assert [c.header for c in uut.columns] == ["Id", "Value"]
+    assert uut.columns[0]._cells == ["1", "2"]
+    assert uut.columns[1]._cells == ["2.5", "3.0"]
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(data, OutputFormat.JSONL, OutputStyle.NONE)
+        lines = mock_stdout.getvalue().splitlines()
+    assert lines == ['{"id": 1, "value": 2.5}', '{"id": 2, "value": 3.0}']
+
+
+def test_numpy_columns():
+    np = pytest.importorskip("numpy")
+    uut = rich_table_factory(ColumnarData({"x": np.arange(3), "y": ["a", "b", "c"]}))
+    assert uut.columns[0]._cells == ["0", "1", "2"]
@@ -1,8 +1,21 @@
 import os
+import re
+import threading
+import time
 from unittest import mock
 
+import pytest
+from rich.console import RenderHook
+
 from rich_objects.console import TEST_TERMINAL_WIDTH
 from rich_objects.console import console_factory
+from rich_objects.console import thread_console
+from rich_objects.constants import DEFAULT_ROW_PROPS
+from rich_objects.display import display
+from rich_objects.enums import OutputFormat
+from rich_objects.render_cache import RenderCache
+from rich_objects.table_config import TableConfig
+from tests.helpers import StringIo
 
 
 def test_console_factory_arg():
@@ -19,3 +32,81 @@ def test_console_factory_env():
 def test_console_factory_pytest():
     uut = console_factory()
     assert TEST_TERMINAL_WIDTH == uut._width
+
+
+class SlowIo(StringIo):
+    """Gives other threads a chance to write in the middle of each write."""
+
+    def write(self, s: str) -> int:
+        half = len(s) // 2
+        super().write(s[:half])
+        time.sleep(0.001)
+        return super().write(s[half:])
+
+
+def test_display_threads():
+    output = SlowIo()
+
+    def job(n):
+        items = [{"name": f"job{n}", "row": i} for i in range(3)]
+        display(items, console=console_factory(file=output))
+
+    threads = [threading.Thread(target=job, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    blocks = output.getvalue().split("Found 3 items")
+    assert len(blocks) == 9
+    for block in blocks[:-1]:
+        assert len(set(re.findall(r"job\d", block))) == 1
+
+
+class HiddenOutput(RenderHook):
+    """Keeps the renderables (e.g. like a live display), rather than printing them."""
+
+    def __init__(self):
+        self.renderables = []
+
+    def process_renderables(self, renderables):
+        self.renderables.extend(renderables)
+        return []
+
+
+@pytest.mark.parametrize("cache", [None, RenderCache()])
+@pytest.mark.parametrize("fmt", [OutputFormat.TABLE, OutputFormat.JSON])
+def test_display_capture(cache, fmt):
+    # the output goes through the console, so a capture (or live display) gets it
+    console = console_factory(file=StringIo())
+    with console.capture() as capture:
+        display({"a": 1}, fmt, console=console, cache=cache)
+        display({"a": 1}, fmt, console=console, cache=cache)
+    assert console.file.getvalue() == ""
+    assert capture.get().count('"a"' if fmt == OutputFormat.JSON else "Value") == 2
+
+    hook = HiddenOutput()
+    console.push_render_hook(hook)
+    display({"a": 1}, fmt, console=console, cache=cache)
+    console.pop_render_hook()
+    assert console.file.getvalue() == ""
+    assert len(hook.renderables) == 1
+
+
+def test_thread_console():
+    assert thread_console() is thread_console()
+    consoles = []
+    thread = threading.Thread(target=lambda: consoles.append(thread_console()))
+    thread.start()
+    thread.join()
+    assert consoles[0] is not thread_console()
+
+
+def test_immutable_defaults():
+    with pytest.raises(TypeError):
+        DEFAULT_ROW_PROPS["no_wrap"] = False
+    config = TableConfig()
+    config.key_fields.append("other")
+    config.row_properties["no_wrap"] = False
+    assert TableConfig().key_fields == ["name", "id"]
+    assert TableConfig().row_properties["no_wrap"] is True
@@ -6,12 +6,20 @@ from unittest import mock
 import pytest
 import yaml
 from rich.box import HEAVY_HEAD
+from rich.console import Console
+from rich.highlighter import RegexHighlighter
+from rich.padding import Padding
+from rich.text import Text
+from rich.theme import Theme
 
 from rich_objects.display import display
+from rich_objects.display import export_targets
 from rich_objects.display import rich_table_factory
 from rich_objects.enums import OutputFormat
 from rich_objects.enums import OutputStyle
 from rich_objects.rich_table import RichTable
+from rich_objects.rich_table import text_cell
+from rich_objects.rich_table import text_width
 from rich_objects.table_config import TableConfig
 from tests.helpers import StringIo
 from tests.helpers import to_ascii
@@ -612,3 +620,339 @@ def test_display_with_config():
     actual = to_ascii(_actual)
     expected = to_ascii(SIMPLE_CONFIG_TABLE)
     assert expected == actual
+
+
+def test_create_table_deep_nesting():
+    data = {"value": "leaf"}
+    for _ in range(5000):
+        data = {"inner": data}
+
+    uut = rich_table_factory(data)
+    for _ in range(5000):
+        uut = uut.columns[1]._cells[0]
+    assert uut.columns[1]._cells == ["leaf"]
+
+
+def test_create_table_cycle():
+    data = {"name": "sna", "items": []}
+    data["self"] = data
+    data["items"].append({"name": "child", "parent": data})
+
+    uut = rich_table_factory(data)
+    col1 = uut.columns[1]
+    assert col1._cells[2] == "<circular reference>"
+    inner = col1._cells[1]
+    assert inner.columns[0]._cells == ["child"]
+    assert inner.columns[1]._cells == ["<circular reference>"]
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(data, OutputFormat.TABLE, OutputStyle.NONE)
+        assert "<circular reference>" in mock_stdout.getvalue()
+
+
+def test_create_table_shared_subtree():
+    shared = {"a": 1, "b": [{"name": "x", "c": 2}]}
+    data = {"first": shared, "second": shared, "list": [shared, shared]}
+
+    uut = rich_table_factory(data)
+    col1 = uut.columns[1]
+    assert col1._cells[0] is col1._cells[1]
+    inner = col1._cells[2].columns[0]._cells
+    assert inner[0] is inner[1]
+    assert inner[0] is col1._cells[0]
+
+
+def test_create_table_mutual_references():
+    first = {"name": "first"}
+    second = {"name": "second", "first": first}
+    first["second"] = second
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display([first, second], OutputFormat.TABLE, OutputStyle.NONE)
+        output = mock_stdout.getvalue()
+        assert output.count("<circular reference>") == 1
+        assert output.count("first") == 2
+
+
+def test_create_table_does_not_modify():
+    data = [{"name": "sna", "abc": 1, "def": 2}, {"name": "foo", "abc": 3}]
+    expected = deepcopy(data)
+    rich_table_factory(data)
+    assert data == expected
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        pytest.param("plain", 5, id="ascii"),
+        pytest.param("\\[red]x\\[/]", 9, id="escaped-markup"),
+        pytest.param("[red]x[/]", 1, id="markup"),
+        pytest.param("日本", 4, id="wide"),
+        pytest.param("a:smile:b", 4, id="emoji"),
+        pytest.param("12:30", 5, id="colon"),
+        pytest.param("ab\nc", 2, id="multi-line"),
+    ]
+)
+def test_text_width(text, expected):
+    assert text_width(text) == expected
+
+
+def test_create_table_fixed_widths():
+    data = deepcopy(INNER_LIST)
+    uut = rich_table_factory(data, fixed_widths=True)
+    assert [c.width for c in uut.columns] == [8, 24]
+    inner = uut.columns[1]._cells[1]
+    assert [c.width for c in inner.columns] == [7, 13]
+
+    # widths are not fixed for wrapped columns
+    config = TableConfig(row_properties={"no_wrap": False})
+    uut = rich_table_factory(deepcopy(INNER_LIST), config, fixed_widths=True)
+    assert [c.width for c in uut.columns] == [None, None]
+
+
+def test_create_table_flexible_widths():
+    uut = rich_table_factory([{"name": "a", "v": 1}])
+    assert [c.width for c in uut.columns] == [None, None]
+
+    # rows added to the table are not clipped
+    uut.add_row("a much longer name here", "another long value")
+    console = Console(file=StringIo(), width=80, color_system=None)
+    console.print(uut)
+    assert "a much longer name here │ another long value" in console.file.getvalue()
+
+
+def test_fixed_widths_match_measured():
+    data = {
+        "unicode": "日本語テキスト café",
+        "markup": "[red]not markup[/]",
+        "emoji": ":smile: face",
+        "list": [{"name": "x" * 40, "value": {"nested": "y" * 60}}, {"name": "z"}],
+    }
+    for width in (30, 100):
+        console = Console(file=StringIo(), width=width)
+        console.print(rich_table_factory(deepcopy(data), fixed_widths=True))
+        fixed = console.file.getvalue()
+
+        console = Console(file=StringIo(), width=width)
+        console.print(rich_table_factory(deepcopy(data)))
+        assert fixed == console.file.getvalue()
+
+
+def test_summary_nested_list():
+    config = TableConfig(summary_threshold=10, summary_items=3)
+    data = {"ids": list(range(1, 101)), "short": [1, 2], "tags": ["a", "b"] * 20}
+    uut = rich_table_factory(data, config)
+    values = uut.columns[1]._cells
+    assert values[0] == "100 items: 1, 2, 3, ... (min=1, max=100, mean=50.5)"
+    assert values[1] == "1, 2"
+    assert values[2] == "40 items: a, b, a, ..."
+
+
+def test_summary_top_level():
+    config = TableConfig(summary_threshold=10, summary_items=2)
+    uut = rich_table_factory([0.5, 2.5] + [1] * 98, config)
+    assert uut.columns[0]._cells == ["0.5", "2.5", "... 98 more (min=0.5, max=2.5, mean=1.01)"]
+    assert uut.caption == "Found 100 items"
+
+    # not summarized by default, or at the threshold
+    assert len(rich_table_factory(list(range(100))).columns[0]._cells) == 100
+    assert len(rich_table_factory(list(range(10)), config).columns[0]._cells) == 10
+
+
+def test_inner_table_templates():
+    first = RichTable.inner("Property", "Value")
+    second = RichTable.inner("Property", "Value")
+    assert type(first) is type(second)
+    assert isinstance(first, RichTable)
+    assert type(first.columns[1]) is type(second.columns[1])
+    assert first.columns[1]._cells is not second.columns[1]._cells
+    # only the rows/cells are allocated for each table
+    assert set(vars(first)) == {"columns", "rows"}
+    assert set(vars(first.columns[1])) == {"_cells", "_index"}
+
+    expected = RichTable("Property", "Value", outer=False, show_lines=False)
+    for table in (first, expected):
+        table.add_row("abc", "def")
+        table.add_row("ghi", "[red]jkl[/red] 123")
+    # includes the styles, so the highlighting must match
+    console = Console(file=StringIo(), width=40, force_terminal=True, color_system="truecolor")
+    console.print(first)
+    console.print(expected)
+    output = console.file.getvalue().split("\n")
+    assert output[:2] == output[2:4]
+
+    # unhashable headers (e.g. Text) use a regular table
+    uut = RichTable.inner(Text("Values"))
+    assert "show_lines" in vars(uut)
+
+
+def _display_text(obj, width, **kwargs):
+    console = Console(file=StringIo(), width=width, color_system=None)
+    display(obj, console=console, **kwargs)
+    return console.file.getvalue()
+
+
+def test_vertical_layout():
+    items = [{"name": f"item-{i}", **{f"field{k}": "x" * 20 for k in range(6)}} for i in range(2)]
+    columns = ["name", "field0", "field1", "field2", "*"]
+    output = _display_text(iter(items), 60, columns=columns)
+    lines = output.splitlines()
+    # a table for each record, rather than a column for each field
+    assert sum(1 for line in lines if "Property" in line) == 2
+    assert max(len(line) for line in lines) <= 60
+    assert lines[-1] == "Found 2 items"
+    # the columns are in order, with the wildcard at the end
+    assert [line.split()[1] for line in lines if "field" in line or "item-0" in line][:5] == [
+        "name", "field0", "field1", "field2", "field3"
+    ]
+
+    # fits in a wider console
+    output = _display_text(items, 200, columns=columns)
+    assert "Field0" in output
+    assert "Property" not in output
+
+    # forced on, or off
+    output = _display_text(items, 200, columns=columns, config=TableConfig(vertical=True))
+    assert "Property" in output
+    output = _display_text(items, 60, columns=columns, config=TableConfig(vertical=False))
+    assert "Property" not in output
+
+
+def test_vertical_layout_nested():
+    items = [{"name": "a", "nested": {"inner": {"deeper": "y" * 50, "other": "z" * 50}}}]
+    output = _display_text(items, 40)
+    assert "Found 1 items" in output
+    assert "Nested" not in output
+    assert "Nested" in _display_text(items, 200)
+
+
+def _display_styled(obj, **kwargs):
+    console = Console(file=StringIo(), width=120, force_terminal=True, color_system="truecolor")
+    display(obj, console=console, **kwargs)
+    return console.file.getvalue()
+
+
+def test_text_cells():
+    items = [
+        {"name": "item-1", "count": 12, "enabled": True, "note": "[red]not markup[/red] :smile:"},
+        {"name": "item-2", "count": None, "tags": ["a", "b"], "nested": {"url": "https://example.com/x"}},
+    ]
+    for obj in (items, items[0], ["[bold]x[/bold]", 1.5]):
+        # same output (including the highlighting), without parsing the values as markup
+        assert _display_styled(obj, config=TableConfig(text_cells=True)) == _display_styled(obj)
+
+    table = rich_table_factory(items, config=TableConfig(text_cells=True))
+    names = table.columns[0]._cells
+    assert all(isinstance(cell, Text) for cell in names)
+    assert names[0].plain == "item-1"
+
+    # truncated based on the displayed text (rather than the escaped markup)
+    config = TableConfig(text_cells=True, value_max_len=10)
+    table = rich_table_factory({"value": "[" * 20}, config=config)
+    assert table.columns[1]._cells[0].plain == "[" * 7 + "..."
+
+    # highlighting is only applied when the columns are highlighted
+    for row_properties in ({"highlight": False}, {"highlight": True}):
+        text = _display_styled(items, config=TableConfig(text_cells=True, row_properties=row_properties))
+        assert text == _display_styled(items, config=TableConfig(row_properties=row_properties))
+
+    # the console highlighter is used
+    class StatusHighlighter(RegexHighlighter):
+        highlights = [r"(?P<failed>failed)"]
+
+    theme = Theme({"failed": "red"})
+    expected = None
+    for config in (TableConfig(), TableConfig(text_cells=True)):
+        console = Console(file=StringIo(), width=120, force_terminal=True, highlighter=StatusHighlighter(), theme=theme)
+        display({"status": "failed"}, console=console, config=config)
+        assert "\x1b[31mfailed" in console.file.getvalue()
+        expected = expected or console.file.getvalue()
+        assert console.file.getvalue() == expected
+
+    # without a column setting, the console decides (and the same cell can be rendered again)
+    cell = text_cell("item-1 has 12")
+    for highlight in (False, True, False):
+        outputs = []
+        for value in (Padding("item-1 has 12", 0), Padding(cell, 0)):
+            console = Console(file=StringIo(), width=120, force_terminal=True, highlight=highlight)
+            console.print(value)
+            outputs.append(console.file.getvalue())
+        assert outputs[0] == outputs[1]
+        assert ("\x1b[1;36m12" in outputs[1]) == highlight
+
+def test_export_targets(tmp_path):
+    items = [{"name": f"item-{i}", "status": "ok" if i % 2 else "failed", "count": i} for i in range(5)]
+    read = []
+
+    def source():
+        for item in items:
+            read.append(item["name"])
+            yield item
+
+    console = Console(file=StringIo(), width=80, color_system=None)
+    jsonl = StringIo()
+    export_targets(
+        source(),
+        [
+            (OutputFormat.TABLE, console),
+            (OutputFormat.JSON, tmp_path / "items.json"),
+            (OutputFormat.CSV, str(tmp_path / "items.csv")),
+            (OutputFormat.JSONL, jsonl),
+        ],
+    )
+    # the iterator is only read once, and every format has all the items
+    assert read == [item["name"] for item in items]
+    assert console.file.getvalue() == _display_text(items, 80)
+    assert json.loads((tmp_path / "items.json").read_text()) == items
+    assert (tmp_path / "items.csv").read_text().splitlines()[-1] == "item-4,failed,4"
+    assert [json.loads(line) for line in jsonl.getvalue().splitlines()] == items
+
+    # without a table, and filtered
+    yaml_file = StringIo()
+    export_targets(items, [(OutputFormat.YAML, yaml_file)], where={"status": "ok"})
+    assert yaml.safe_load(yaml_file.getvalue()) == items[1::2]
+
+
+def test_export_targets_object():
+    console = Console(file=StringIo(), width=80, color_system=None)
+    json_file = StringIo()
+    export_targets(SIMPLE_DICT, [(OutputFormat.JSON, json_file), (OutputFormat.TABLE, console)])
+    assert json_file.getvalue() == json.dumps(SIMPLE_DICT, indent=2) + "\n"
+    assert console.file.getvalue() == _display_text(SIMPLE_DICT, 80)
+
+    # an empty list still writes valid JSON
+    export_targets([], [(OutputFormat.JSON, json_file), (OutputFormat.TABLE, console)])
+    assert json_file.getvalue().endswith("[]\n")
+    assert console.file.getvalue().endswith("Nothing found\n")
+
+
+def test_export_targets_list_layout():
+    # a list keeps the layout display() uses, e.g. the summary of a long list
+    items = [{"name": f"item-{i}", "count": i} for i in range(20)]
+    config = TableConfig(summary_threshold=10, summary_items=3)
+    console = Console(file=StringIo(), width=80, color_system=None)
+    jsonl = StringIo()
+    export_targets(items, [(OutputFormat.TABLE, console), (OutputFormat.JSONL, jsonl)], config=config)
+    assert console.file.getvalue() == _display_text(items, 80, config=config)
+    assert len(jsonl.getvalue().splitlines()) == 20
+
+    # a table per record on a narrow console, for a list or iterator
+    items = [{"name": f"item-{i}", **{f"field{k}": "x" * 20 for k in range(6)}} for i in range(2)]
+    columns = ["name", "field0", "field1", "field2", "*"]
+    for obj in (items, iter(items)):
+        narrow = Console(file=StringIo(), width=60, color_system=None)
+        wide = Console(file=StringIo(), width=200, color_system=None)
+        json_file = StringIo()
+        targets = [(OutputFormat.TABLE, narrow), (OutputFormat.TABLE, wide), (OutputFormat.JSON, json_file)]
+        export_targets(obj, targets, columns=columns)
+        assert narrow.file.getvalue() == _display_text(items, 60, columns=columns)
+        assert "Property" in narrow.file.getvalue()
+        assert wide.file.getvalue() == _display_text(items, 200, columns=columns)
+        assert json.loads(json_file.getvalue()) == items
+
+
+def test_export_targets_csv_mixed():
+    # a value after the records of an iterator goes in the first column
+    csv_file = StringIo()
+    export_targets(iter([{"a": 1, "b": 2}, 5]), [(OutputFormat.CSV, csv_file)])
+    assert csv_file.getvalue().splitlines() == ["a,b", "1,2", "5"]
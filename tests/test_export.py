@@ -0,0 +1,68 @@
+import io
+
+import pytest
+from rich.console import Console
+
+from rich_objects.console import console_factory
+from rich_objects.display import display
+from rich_objects.display import rich_table_factory
+from rich_objects.enums import OutputFormat
+from rich_objects.export import export_html
+from rich_objects.export import export_svg
+
+DATA = [
+    {"name": "a<b", "count": i, "nested": {"values": [1, 2], "text": "x " * i}}
+    for i in range(12)
+]
+
+
+def _recorded(obj, width):
+    console = Console(record=True, width=width, file=io.StringIO())
+    console.print(obj)
+    return console
+
+
+@pytest.mark.parametrize("width", [40, 100])
+def test_export_html_matches_rich(width):
+    table = rich_table_factory(DATA)
+    expected = _recorded(table, width).export_html(inline_styles=True)
+
+    buffer = io.StringIO()
+    export_html(table, buffer, console=Console(width=width, file=io.StringIO()))
+    assert buffer.getvalue() == expected
+
+
+@pytest.mark.parametrize("width", [40, 100])
+@pytest.mark.parametrize("unique_id", [None, "report"])
+def test_export_svg_matches_rich(width, unique_id):
+    table = rich_table_factory(DATA)
+    expected = _recorded(table, width).export_svg(title="Items", unique_id=unique_id)
+
+    buffer = io.StringIO()
+    export_svg(table, buffer, console=Console(width=width, file=io.StringIO()), title="Items", unique_id=unique_id)
+    assert buffer.getvalue() == expected
+
+
+def test_export_string():
+    expected = _recorded("[bold]done[/bold]", 80)
+    buffer = io.StringIO()
+    export_html("[bold]done[/bold]", buffer, console=Console(width=80, file=io.StringIO()))
+    assert buffer.getvalue() == expected.export_html(inline_styles=True)
+    assert "font-weight: bold" in buffer.getvalue()
+
+
+@pytest.mark.parametrize("fmt", [OutputFormat.HTML, OutputFormat.SVG])
+def test_display_export(fmt):
+    buffer = io.StringIO()
+    display(iter(DATA), fmt=fmt, console=console_factory(file=buffer))
+    output = buffer.getvalue()
+    expected = "<!DOCTYPE html>" if fmt == OutputFormat.HTML else "<svg"
+    assert output.startswith(expected)
+    assert "a&lt;b" in output
+    assert "Found&#160;12&#160;items" in output or "Found 12 items" in output
+
+
+def test_display_export_empty():
+    buffer = io.StringIO()
+    display([], fmt=OutputFormat.HTML, console=console_factory(file=buffer))
+    assert "Nothing found" in buffer.getvalue()
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from rich_objects.columnar import ColumnarData
+from rich_objects.display import display
+from rich_objects.display import rich_table_factory
+from rich_objects.enums import OutputFormat
+from rich_objects.enums import OutputStyle
+from rich_objects.filters import apply_where
+from rich_objects.filters import compile_where
+from tests.helpers import StringIo
+
+ITEMS = [
+    {"name": "a", "status": "ok", "region": "us", "count": 3, "spec": {"zone": "1a"}},
+    {"name": "b", "status": "failed", "region": "eu", "count": 10},
+    {"name": "c", "status": "pending", "region": "ap", "count": None, "spec": {"zone": "2b"}},
+]
+
+
+@dataclass
+class Item:
+    name: str
+    status: str
+
+
+def _names(where):
+    return [item["name"] for item in ITEMS if compile_where(where)(item)]
+
+
+@pytest.mark.parametrize(
+    ["where", "expected"],
+    [
+        pytest.param('status != "ok"', ["b", "c"], id="not-equal"),
+        pytest.param("region in {'us', 'eu'}", ["a", "b"], id="in-set"),
+        pytest.param("region not in ['us']", ["b", "c"], id="not-in-list"),
+        pytest.param("count > 5", ["b"], id="greater-none"),
+        pytest.param("1 < count <= 3", ["a"], id="chained"),
+        pytest.param("count is None or status == 'ok'", ["a", "c"], id="or"),
+        pytest.param("not (status == 'ok' and count)", ["b", "c"], id="not-and"),
+        pytest.param("spec.zone == '2b'", ["c"], id="nested"),
+        pytest.param("missing", [], id="missing"),
+        pytest.param("spec", ["a", "c"], id="truthy"),
+    ],
+)
+def test_where_expression(where, expected):
+    assert _names(where) == expected
+
+
+@pytest.mark.parametrize(
+    ["where", "expected"],
+    [
+        pytest.param({"status": "ok"}, ["a"], id="value"),
+        pytest.param({"region": ["us", "ap"], "count": None}, ["c"], id="values"),
+        pytest.param({"count": lambda c: c is not None and c > 1}, ["a", "b"], id="function"),
+        pytest.param({"spec.zone": {"1a"}}, ["a"], id="nested"),
+        pytest.param(lambda item: item["name"] > "a", ["b", "c"], id="predicate"),
+    ],
+)
+def test_where_mapping(where, expected):
+    assert _names(where) == expected
+
+
+@pytest.mark.parametrize(
+    "where",
+    [
+        pytest.param("status ==", id="syntax"),
+        pytest.param("len(name) > 1", id="call"),
+        pytest.param("name == other[0]", id="subscript"),
+        pytest.param("count + 1 > 2", id="arithmetic"),
+        pytest.param("x in {[1]}", id="unhashable"),
+        pytest.param("x == " + "1 + " * 100000 + "1", id="deep"),
+        pytest.param(5, id="type"),
+    ],
+)
+def test_where_invalid(where):
+    with pytest.raises(ValueError):
+        compile_where(where)
+
+
+def test_where_objects():
+    items = [Item("a", "ok"), Item("b", "failed")]
+    assert apply_where(items, "status == 'ok'") == items[:1]
+
+    # iterators are filtered as they are read
+    read = []
+
+    def source():
+        for item in ITEMS:
+            read.append(item["name"])
+            yield item
+
+    filtered = apply_where(source(), {"status": "failed"})
+    assert read == []
+    assert next(filtered)["name"] == "b"
+    assert read == ["a", "b"]
+
+    # a single record is not filtered
+    assert apply_where(ITEMS[0], "status == 'failed'") is ITEMS[0]
+
+
+def test_where_columnar():
+    data = ColumnarData({"name": ["a", "b", "c"], "count": np.array([1, 2, 3])})
+    uut = apply_where(data, "count >= 2")
+    assert len(uut) == 2
+    assert list(uut.records()) == [{"name": "b", "count": 2}, {"name": "c", "count": 3}]
+
+    array = np.array([("a", 1), ("b", 2)], dtype=[("name", "U5"), ("count", "i4")])
+    assert list(apply_where(array, "name == 'a'").records()) == [{"name": "a", "count": 1}]
+
+    # the rows are checked using a view of the columns, rather than a dictionary per row
+    with mock.patch.object(ColumnarData, "records") as records:
+        uut = apply_where(data, {"name": {"a", "c"}, "count": lambda c: c > 1, "missing": None})
+        records.assert_not_called()
+    assert uut.values(0) == ["c"]
+    seen = []
+    apply_where(data, lambda row: seen.append(dict(row)))
+    assert seen == [{"name": "a", "count": 1}, {"name": "b", "count": 2}, {"name": "c", "count": 3}]
+
+
+def test_where_table():
+    with mock.patch("rich_objects.display.TableBuilder.cell_value", autospec=True) as cell_value:
+        cell_value.return_value = ""
+        rich_table_factory(ITEMS, where='status != "ok"')
+    # the cells are only built for the matching items
+    assert [call.args[1] for call in cell_value.call_args_list] == [ITEMS[1], ITEMS[2]]
+
+    table = rich_table_factory(iter(ITEMS), columns=["name"], where={"region": "eu"})
+    assert table.columns[0]._cells == ["b"]
+    assert table.row_count == 1
+
+
+def test_where_display():
+    with mock.patch("sys.stdout", new_callable=StringIo) as mock_stdout:
+        display(iter(ITEMS), OutputFormat.JSONL, OutputStyle.NONE, where="count is not None")
+        lines = mock_stdout.getvalue().splitlines()
+    assert [line[:12] for line in lines] == ['{"name": "a"', '{"name": "b"']
+
+    with mock.patch("sys.stdout", new_callable=StringIo) as mock_stdout:
+        display(ITEMS, OutputFormat.TABLE, OutputStyle.NONE, where="status == 'unknown'")
+        assert mock_stdout.getvalue() == "Nothing found\n"
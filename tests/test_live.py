@@ -0,0 +1,75 @@
+from copy import deepcopy
+
+from rich_objects.console import console_factory
+from rich_objects.live import LiveDisplay
+from tests.helpers import StringIo
+
+ITEMS = [
+    {"name": "sna", "status": "ok", "detail": {"a": 1}},
+    {"name": "foo", "status": "ok", "detail": {"a": 2}},
+    {"name": "bar", "status": "failed", "detail": {"a": 3}},
+]
+
+
+def _cells(table, index):
+    return table.columns[index]._cells
+
+
+def test_live_table_reuses_rows():
+    uut = LiveDisplay()
+    first = uut.table(ITEMS)
+    assert uut.rebuilt == 3
+    assert first.caption == "Found 3 items"
+    assert _cells(first, 0) == ["sna", "foo", "bar"]
+
+    # unchanged snapshot reuses every cell
+    second = uut.table(deepcopy(ITEMS))
+    assert uut.rebuilt == 0
+    for a, b in zip(_cells(first, 1), _cells(second, 1)):  # noqa: B905
+        assert a is b
+
+    # changed, removed, and added rows
+    items = deepcopy(ITEMS)
+    items[0]["status"] = "failed"
+    del items[1]
+    items.append({"name": "new", "status": "ok"})
+    third = uut.table(items)
+    assert uut.rebuilt == 2
+    assert _cells(third, 0) == ["sna", "bar", "new"]
+    assert _cells(third, 1)[1] is _cells(first, 1)[2]
+    assert _cells(third, 1)[0] is not _cells(first, 1)[0]
+
+
+def test_live_table_layout_change():
+    uut = LiveDisplay()
+    uut.table(ITEMS)
+    table = uut.table([{"id": 1, "value": "x"}])
+    assert uut.rebuilt == 1
+    assert [c.header for c in table.columns] == ["Id", "Value"]
+
+
+def test_live_table_duplicate_and_missing_keys():
+    uut = LiveDisplay()
+    items = [{"name": "a", "v": 1}, {"name": "a", "v": 2}, {"v": 3}]
+    table = uut.table(items)
+    assert _cells(table, 0) == ["a", "a", "Unknown"]
+    uut.table(deepcopy(items))
+    assert uut.rebuilt == 0
+
+
+def test_live_table_other_inputs():
+    uut = LiveDisplay()
+    table = uut.table([])
+    assert table.caption == "Found 0 items"
+    table = uut.table(["a", "b"])
+    assert _cells(table, 0) == ["a", "b"]
+    assert uut.rebuilt == 2
+
+
+def test_live_update():
+    output = StringIo()
+    console = console_factory(file=output, force_terminal=False)
+    with LiveDisplay(console=console) as uut:
+        uut.update(ITEMS)
+        uut.update(ITEMS)
+    assert "sna" in output.getvalue()
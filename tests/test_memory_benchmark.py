@@ -0,0 +1,56 @@
+from unittest import mock
+
+import pytest
+
+from benchmarks import memory
+from benchmarks.memory import Measurement
+
+
+def test_measure():
+    uut = memory.measure(lambda: [bytearray(1000) for _ in range(100)], 100)
+    assert uut.peak >= 100_000
+    assert uut.retained >= 100_000
+    assert uut.peak_per_row >= 1000
+
+    uut = memory.measure(lambda: [bytearray(1000) for _ in range(100)] and None, 100)
+    assert uut.peak >= 100_000
+    assert uut.retained < 10_000
+
+    # errors from the build are raised (and tracing is stopped)
+    with pytest.raises(ZeroDivisionError):
+        memory.measure(lambda: 1 / 0, 1)
+    assert not memory.tracemalloc.is_tracing()
+
+
+def test_run():
+    results = memory.run(sizes=[10], cases=["rich_table", "columnar"])
+    assert set(results) == {"rich_table/10", "columnar/10"}
+    assert all(m.rows == 10 and m.peak > 0 for m in results.values())
+
+
+def test_compare():
+    baselines = {"a/10": {"peak": 100_000, "retained": 50_000}}
+    assert memory.compare({"a/10": Measurement(peak=105_000, retained=50_000, rows=10)}, baselines) == []
+    assert memory.compare({"b/10": Measurement(peak=900_000, retained=900_000, rows=10)}, baselines) == []
+    failures = memory.compare({"a/10": Measurement(peak=200_000, retained=50_000, rows=10)}, baselines)
+    assert len(failures) == 1
+    assert failures[0].startswith("a/10 peak: 200,000 bytes")
+    # small increases are noise
+    baselines = {"a/10": {"peak": 1000, "retained": 1000}}
+    assert memory.compare({"a/10": Measurement(peak=5000, retained=5000, rows=10)}, baselines) == []
+
+
+def test_baselines(tmp_path):
+    path = tmp_path / "baseline.json"
+    assert memory.load_baselines(path) == {}
+    memory.save_baselines({"a/10": Measurement(peak=1, retained=2, rows=10)}, path)
+    assert memory.load_baselines(path) == {memory.python_version(): {"a/10": {"peak": 1, "retained": 2}}}
+    assert memory.BASELINE_FILE.exists()
+
+
+def test_main_no_baselines(capsys):
+    results = {"a/10": Measurement(peak=1, retained=2, rows=10)}
+    with mock.patch.object(memory, "run", return_value=results):
+        with mock.patch.object(memory, "load_baselines", return_value={}):
+            assert memory.main([]) == 1
+    assert f"No baselines for {memory.python_version()}" in capsys.readouterr().out
@@ -0,0 +1,84 @@
+import io
+from unittest import mock
+
+from rich.console import Console
+
+from rich_objects.display import display
+from rich_objects.pager import LazyPager
+
+ITEMS = [{"name": f"item-{i}", "value": i} for i in range(100)]
+
+
+def _console(height=24):
+    return Console(width=60, height=height, file=io.StringIO(), force_terminal=True, color_system=None)
+
+
+def test_pages_fit_screen():
+    console = _console()
+    uut = LazyPager(ITEMS, console=console)
+    first = uut.page(0)
+    assert first.count("\n") <= uut.height
+    assert "item-0 " in first
+    assert "Items 1-" in first
+    # header is repeated on the next page
+    second = uut.page(1)
+    assert second.splitlines()[1].split() == first.splitlines()[1].split()
+    assert "item-0 " not in second
+    assert uut.rendered == 2
+
+
+def test_pages_are_lazy():
+    def items():
+        for i in range(1000):
+            read.append(i)
+            yield {"name": f"item-{i}", "value": i}
+
+    read = []
+    uut = LazyPager(items(), console=_console())
+    assert not read
+    uut.page(0)
+    assert len(read) < 50
+    assert uut.last_page is None
+
+
+def test_page_cache():
+    uut = LazyPager(ITEMS, console=_console(), cache_pages=2)
+    pages = [uut.page(i) for i in range(3)]
+    assert uut.rendered == 3
+    assert uut.page(2) is pages[2]
+    assert uut.rendered == 3
+    # evicted page is rendered again, with the same items
+    assert uut.page(0) == pages[0]
+    assert uut.rendered == 4
+
+
+def test_last_page():
+    uut = LazyPager(iter(ITEMS), console=_console())
+    number = 0
+    while uut.page(number) is not None:
+        number += 1
+    assert uut.last_page == number - 1
+    assert "-100" in uut.page(number - 1)
+
+
+def test_run():
+    console = _console()
+    with mock.patch("builtins.input", side_effect=["", "b", "", "q"]) as prompt:
+        LazyPager(ITEMS, console=console).run()
+    assert prompt.call_count == 4
+    output = console.file.getvalue()
+    assert output.count("Items 1-") == 2
+    assert "Page 2" in output
+
+
+def test_run_static():
+    console = _console(height=10)
+    with mock.patch("builtins.input", side_effect=["", "", ""]):
+        LazyPager({"a": 1, "b": {"c": [1, 2, 3]}, "d": "x"}, console=console).run()
+    assert "Page 1" in console.file.getvalue()
+
+
+def test_display_pager_not_terminal():
+    console = Console(width=60, height=10, file=io.StringIO())
+    display(ITEMS[:3], console=console, pager=True)
+    assert "Found 3 items" in console.file.getvalue()
@@ -0,0 +1,175 @@
+import os
+import sys
+import threading
+from typing import NamedTuple
+from unittest import mock
+
+from rich.console import Console
+
+from rich_objects.columnar import ColumnarData
+from rich_objects.display import display
+from rich_objects.enums import OutputFormat
+from rich_objects.enums import OutputStyle
+from rich_objects.render_cache import RenderCache
+from rich_objects.render_cache import content_hash
+from rich_objects.table_config import TableConfig
+from tests.helpers import StringIo
+
+DATA = [
+    {"name": "sna", "value": 1},
+    {"name": "foo", "value": {"a": 1, "b": [1, 2]}},
+]
+
+
+class Pair(NamedTuple):
+    a: int
+    b: int
+
+
+def test_content_hash():
+    assert content_hash(DATA, "table") == content_hash(list(DATA), "table")
+    assert content_hash(DATA, "table") != content_hash(DATA, "json")
+    assert content_hash(DATA, TableConfig()) != content_hash(DATA, TableConfig(key_max_len=3))
+    assert content_hash({"a": 1}) != content_hash({"a": "1"})
+    cols = ColumnarData({"a": [1, 2]})
+    assert content_hash(cols) == content_hash(ColumnarData({"a": [1, 2]}))
+
+    circular = {}
+    circular["self"] = circular
+    assert content_hash(circular) is None
+
+    # the container types are displayed differently, so they hash differently
+    assert content_hash({"a": (1, 2)}) != content_hash({"a": [1, 2]})
+    assert content_hash(Pair(1, 2)) != content_hash((1, 2))
+    assert content_hash(cols) != content_hash({"a": [1, 2]})
+
+    # deeper than the recursion limit
+    deep = current = {}
+    for _ in range(3000):
+        current["next"] = current = {}
+    assert content_hash(deep) is not None
+
+
+def test_memory_lru():
+    uut = RenderCache(max_entries=2)
+    uut.put("a", "A")
+    uut.put("b", "B")
+    assert uut.get("a") == "A"
+    uut.put("c", "C")  # evicts "b", since "a" was used more recently
+    assert len(uut) == 2
+    assert uut.get("b") is None
+    assert uut.get("c") == "C"
+    assert uut.stats.hits == 2
+    assert uut.stats.misses == 1
+    assert uut.stats.hit_rate == 2 / 3
+
+
+def test_disk_tier(tmp_path):
+    uut = RenderCache(max_entries=1, directory=tmp_path, max_disk_bytes=25)
+    uut.put("a", "a" * 10)
+    uut.put("b", "b" * 10)
+    assert uut.get("a") == "a" * 10
+    assert uut.stats.disk_hits == 1
+
+    # entries survive a new instance
+    uut = RenderCache(directory=tmp_path, max_disk_bytes=25)
+    assert uut.get("b") == "b" * 10
+
+    # oldest file is removed when over the size limit
+    os.utime(tmp_path / "a.render", (1, 1))
+    uut.put("c", "c" * 10)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.render", "c.render"]
+
+    uut.clear()
+    assert list(tmp_path.iterdir()) == []
+    assert uut.get("c") is None
+
+
+def _display(obj, cache, fmt=OutputFormat.TABLE) -> str:
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(obj, fmt, OutputStyle.NONE, cache=cache)
+        return mock_stdout.getvalue()
+
+
+def test_display_cache():
+    cache = RenderCache()
+    expected = _display(DATA, None)
+    assert _display(DATA, cache) == expected
+    assert cache.stats.misses == 1
+
+    with mock.patch("rich_objects.display.rich_table_factory") as factory:
+        assert _display(DATA, cache) == expected
+        factory.assert_not_called()
+    assert cache.stats.hits == 1
+
+    # different format is a different entry
+    assert _display(DATA, cache, OutputFormat.JSONL) == _display(DATA, None, OutputFormat.JSONL)
+    assert _display(DATA, cache, OutputFormat.JSONL) == _display(DATA, None, OutputFormat.JSONL)
+    assert cache.stats.misses == 2
+    assert cache.stats.hits == 2
+
+
+def test_display_cache_bypass():
+    cache = RenderCache()
+    assert _display(iter(DATA), cache) == _display(DATA, None)
+    assert _display("text", cache) == "text\n"
+    assert cache.stats.lookups == 0
+
+
+def test_display_cache_record():
+    cache = RenderCache()
+    console = Console(file=StringIo(), width=80, record=True)
+    display(DATA, console=console, cache=cache)
+    assert "sna" in console.export_text()
+    assert cache.stats.lookups == 0
+
+
+def test_display_cache_console():
+    # the output of other consoles depends on their settings (e.g. no_color, theme), so it is not cached
+    cache = RenderCache()
+    outputs = []
+    for no_color in (False, True):
+        console = Console(file=StringIo(), width=80, color_system="truecolor", force_terminal=True, no_color=no_color)
+        display({"a": 1}, console=console, cache=cache)
+        outputs.append(console.file.getvalue())
+    assert "\x1b[1;36m1" in outputs[0]
+    assert "\x1b[1;36m1" not in outputs[1]
+    assert "\x1b[1m1" in outputs[1]
+    assert cache.stats.lookups == 0
+
+
+def test_display_cache_threads():
+    cache = RenderCache()
+    output = StringIo()
+    errors = []
+
+    def worker(index):
+        try:
+            for run in range(5):
+                # different data each time, so it is rendered (rather than found in the cache)
+                data = [{"name": f"thread-{index}", "value": i} for i in range(run, run + 200)]
+                display(data, OutputFormat.CSV, cache=cache)
+        except Exception as ex:  # noqa: BLE001
+            errors.append(ex)
+
+    # switch threads often, so the renders overlap
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with mock.patch("sys.stdout", output):
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors
+    assert cache.stats.lookups == 20
+    # each output is written whole, and only contains the rows of its own thread
+    blocks = output.getvalue().split("name,value\n")[1:]
+    assert len(blocks) == 20
+    for block in blocks:
+        lines = block.splitlines()
+        assert len(lines) == 200
+        assert len({line.split(",")[0] for line in lines}) == 1
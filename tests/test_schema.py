@@ -0,0 +1,80 @@
+from rich_objects.display import rich_table_factory
+from rich_objects.schema import infer_schema
+from rich_objects.schema import sample_items
+from rich_objects.schema import schema_cache_info
+from rich_objects.table_config import TableConfig
+
+KEY_FIELDS = ["name", "id"]
+
+
+def test_infer_schema():
+    items = [{"id": 1, "value": "a"}, {"name": "x", "id": 2, "value": "b"}, {"id": 3, "value": "c"}]
+    uut = infer_schema(items, KEY_FIELDS)
+    assert uut.keys == ("id", "value", "name")
+    assert uut.signature == (("id", "value"), ("name", "id", "value"))
+    # the name is not in every item, so the id is used
+    assert uut.name_key == "id"
+    assert uut.other_key is None
+
+
+def test_infer_schema_other_key():
+    uut = infer_schema([{"name": "a", "v": 1}, {"v": 2, "name": "b"}], KEY_FIELDS)
+    assert uut.name_key == "name"
+    assert uut.other_key == "v"
+
+    uut = infer_schema([{"name": "a", "v": 1}, {"name": "b", "w": 2}], KEY_FIELDS)
+    assert uut.other_key is None
+
+    uut = infer_schema([{"a": 1}, {"id": 2}], KEY_FIELDS)
+    assert uut.name_key == "id"
+
+    uut = infer_schema([{"a": 1}, 3], KEY_FIELDS)
+    assert uut.name_key is None
+
+
+def test_schema_cache():
+    items = [{"name": f"n{i}", "cache_test": i} for i in range(10)]
+    first = infer_schema(items, KEY_FIELDS)
+    hits = schema_cache_info().hits
+    second = infer_schema(list(reversed(items))[:5], KEY_FIELDS)
+    assert (second.keys, second.name_key, second.other_key) == (first.keys, first.name_key, first.other_key)
+    assert schema_cache_info().hits == hits + 1
+    # the frequencies are from the items, rather than the cache
+    assert (first.count, second.count) == (10, 5)
+    assert second.frequencies == (5, 5)
+
+
+def test_schema_frequencies():
+    items = [{"id": 1, "value": "a"}, {"id": 2}, {"id": 3, "value": "c", "extra": True}, 5]
+    uut = infer_schema(items, KEY_FIELDS)
+    assert uut.count == 4
+    assert uut.keys == ("id", "value", "extra")
+    assert uut.frequencies == (3, 2, 1)
+    assert uut.frequency("value") == 2
+    assert uut.frequency("missing") == 0
+
+
+def test_sample_items():
+    items = [1, 2, 3, 4]
+    assert sample_items(items, 2) == ([1, 2], items)
+    assert sample_items(items, None) == (items, items)
+
+    sample, rest = sample_items(iter(items), 2)
+    assert sample == [1, 2]
+    assert list(rest) == items
+
+
+def test_infer_layout():
+    items = [{"name": "a", "status": "ok"}, {"name": "b", "status": "failed", "detail": "disk"}]
+    # the first item has a single "other" key, but the second does not
+    uut = rich_table_factory(items)
+    assert [c.header for c in uut.columns] == ["Name", "Status"]
+
+    uut = rich_table_factory(items, TableConfig(infer_schema=True))
+    assert [c.header for c in uut.columns] == ["Name", "Properties"]
+    assert uut.caption == "Found 2 items"
+
+    # only the sample is used to choose the layout
+    uut = rich_table_factory(iter(items), TableConfig(infer_schema=True, schema_sample=1))
+    assert [c.header for c in uut.columns] == ["Name", "Status"]
+    assert uut.row_count == 2
@@ -0,0 +1,180 @@
+import io
+import json
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+
+from rich_objects.__main__ import main
+from rich_objects.display import display
+from rich_objects.display import rich_table_factory
+from rich_objects.enums import OutputFormat
+from rich_objects.enums import OutputStyle
+from rich_objects.streaming import peek
+from rich_objects.streaming import read_json
+from tests.helpers import StringIo
+from tests.helpers import to_ascii
+
+ITEMS = [
+    {"name": "sna", "value": 12345, "text": "café " * 5},
+    {"name": "foo", "value": [1.5, -2e10, None], "nested": {"a": True}},
+    {"name": "bar", "value": "x" * 100},
+]
+
+
+@pytest.fixture
+def small_chunks():
+    # force values to be split across chunks
+    with mock.patch("rich_objects.streaming.CHUNK_SIZE", 7):
+        yield
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_read_json_array(tmp_path, small_chunks, use_mmap):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(ITEMS, indent=2), encoding="utf-8")
+
+    uut = read_json(path, use_mmap=use_mmap)
+    assert isinstance(uut, Iterator)
+    assert list(uut) == ITEMS
+
+
+def test_read_json_lines(tmp_path, small_chunks):
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps(i) for i in ITEMS) + "\n", encoding="utf-8")
+
+    assert list(read_json(str(path))) == ITEMS
+    assert list(read_json(str(path), lines=True)) == ITEMS
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        read_json(str(path), lines=False)
+    assert excinfo.match("Extra data")
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        pytest.param('{"a": [1, 2]}', {"a": [1, 2]}, id="object"),
+        pytest.param("  123  ", 123, id="number"),
+        pytest.param("[]", [], id="empty-array"),
+        pytest.param(" [ 1 ,2, 3 ] ", [1, 2, 3], id="array"),
+    ]
+)
+def test_read_json_file_object(small_chunks, text, expected):
+    uut = read_json(io.StringIO(text))
+    if isinstance(uut, Iterator):
+        uut = list(uut)
+    assert uut == expected
+
+    uut = read_json(io.BytesIO(text.encode()))
+    if isinstance(uut, Iterator):
+        uut = list(uut)
+    assert uut == expected
+
+
+@pytest.mark.parametrize(
+    ["text", "message"],
+    [
+        pytest.param("", "Expecting value", id="empty"),
+        pytest.param("[1, 2", "Expecting ',' or ']'", id="unterminated"),
+        pytest.param("[1 2]", "Expecting ',' or ']'", id="missing-comma"),
+        pytest.param('[{"a": }]', "Expecting value", id="bad-value"),
+        pytest.param("[1, 2] garbage", "Extra data", id="extra-data"),
+        pytest.param("[1, 2]\n[3, 4]\n", "Extra data", id="array-lines"),
+    ]
+)
+def test_read_json_errors(text, message):
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        uut = read_json(io.StringIO(text))
+        list(uut)
+    assert excinfo.match(message)
+
+
+def test_read_json_array_lines():
+    assert list(read_json(io.StringIO("[1, 2]\n[3, 4]\n"), lines=True)) == [[1, 2], [3, 4]]
+    with pytest.raises(json.JSONDecodeError, match="Extra data"):
+        list(read_json(io.StringIO("[1, 2]\n[3, 4]\n"), lines=False))
+
+
+def test_read_json_stdin():
+    with mock.patch("sys.stdin", io.StringIO(json.dumps(ITEMS))):
+        assert list(read_json()) == ITEMS
+
+
+def test_peek():
+    assert peek([]) == (mock.ANY, [])
+    first, items = peek(iter([1, 2]))
+    assert first == 1
+    assert list(items) == [1, 2]
+
+
+def test_table_from_iterator():
+    uut = rich_table_factory(iter(json.loads(json.dumps(ITEMS))))
+    assert uut.row_count == 3
+    assert uut.caption == "Found 3 items"
+    assert uut.columns[0]._cells == ["sna", "foo", "bar"]
+
+    uut = rich_table_factory(i for i in [1, "a", None])
+    assert uut.columns[0]._cells == ["1", "a", "None"]
+
+    with pytest.raises(ValueError) as excinfo:
+        rich_table_factory(iter([]))
+    assert excinfo.match("Unable to create table for type list_iterator")
+
+
+@pytest.mark.parametrize(
+    ["fmt", "expected"],
+    [
+        pytest.param(OutputFormat.TABLE, "Nothing found", id="table"),
+        pytest.param(OutputFormat.JSON, "[]", id="json"),
+        pytest.param(OutputFormat.JSONL, "", id="jsonl"),
+        pytest.param(OutputFormat.CSV, "", id="csv"),
+    ]
+)
+def test_display_empty_iterator(fmt, expected):
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(iter([]), fmt, OutputStyle.NONE)
+        assert to_ascii(mock_stdout.getvalue()) == expected
+
+
+def test_display_mixed_iterator():
+    # only the first item is checked, so a later record still gets its (filled) nested table
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(iter([1, {"sna": "foo"}]), OutputFormat.TABLE, OutputStyle.NONE)
+        output = mock_stdout.getvalue()
+    assert "sna" in output
+    assert "foo" in output
+
+
+def test_display_csv_iterator():
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        display(iter(ITEMS), OutputFormat.CSV, OutputStyle.NONE, columns=["name", "*"])
+        lines = mock_stdout.getvalue().splitlines()
+    # fields come from the first item
+    assert lines[0] == "name,value,text"
+    assert lines[2] == 'foo,"[1.5, -20000000000.0, null]",'
+
+
+def test_main(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(ITEMS), encoding="utf-8")
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        assert main(["--fmt", "jsonl", str(path)]) == 0
+        lines = mock_stdout.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == ITEMS
+
+    with mock.patch('sys.stdout', new_callable=StringIo) as mock_stdout:
+        assert main(["--fmt", "table", "--style", "none", "--no-mmap", str(path)]) == 0
+        output = mock_stdout.getvalue()
+    assert "Found 3 items" in output
+
+
+def test_main_errors(tmp_path):
+    with mock.patch('sys.stderr', new_callable=StringIo) as mock_stderr:
+        assert main([str(tmp_path / "missing.json")]) == 1
+        assert "Error: " in mock_stderr.getvalue()
+
+    path = tmp_path / "bad.json"
+    path.write_text("[1, ", encoding="utf-8")
+    with mock.patch('sys.stderr', new_callable=StringIo) as mock_stderr:
+        assert main([str(path)]) == 1
+        assert "Expecting value" in mock_stderr.getvalue()
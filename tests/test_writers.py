@@ -0,0 +1,106 @@
+import io
+import json
+
+import pytest
+import yaml
+
+from rich_objects.columnar import ColumnarData
+from rich_objects.writers import CsvWriter
+from rich_objects.writers import write_csv
+from rich_objects.writers import write_json
+from rich_objects.writers import write_jsonl
+from rich_objects.writers import write_yaml
+
+ITEMS = [
+    {"name": "sna", "id": 1},
+    {"name": "foo", "extra": {"a": 1}},
+    {"name": "bar", "id": 3, "tags": ["x", "y"]},
+]
+
+
+def _csv(obj, columns=None) -> list[str]:
+    out = io.StringIO()
+    write_csv(obj, out, columns=columns)
+    return out.getvalue().splitlines()
+
+
+def test_csv_records():
+    assert _csv(ITEMS) == [
+        "name,id,extra,tags",
+        "sna,1,,",
+        'foo,,"{""a"": 1}",',
+        'bar,3,,"[""x"", ""y""]"',
+    ]
+
+
+def test_csv_columns():
+    assert _csv(ITEMS, ["id", "name"]) == ["id,name", "1,sna", ",foo", "3,bar"]
+    assert _csv(ITEMS, ["name", "*"])[0] == "name,id,extra,tags"
+
+
+def test_csv_object():
+    assert _csv({"a": 1, "b": None}) == ["a,b", "1,"]
+
+
+def test_csv_scalars():
+    assert _csv(["a", 1, None]) == ["Items", "a", "1", '""']
+
+
+def test_jsonl():
+    out = io.StringIO()
+    write_jsonl(ITEMS, out)
+    lines = out.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == ITEMS
+
+    out = io.StringIO()
+    write_jsonl({"a": 1}, out)
+    assert out.getvalue() == '{"a": 1}\n'
+
+
+def test_csv_writer():
+    out = io.StringIO()
+    writer = CsvWriter(out)
+    for item in ITEMS:
+        writer.write(item)
+    writer.close()
+    # the fields are from the first record
+    assert out.getvalue().splitlines() == ["name,id", "sna,1", "foo,", "bar,3"]
+
+    out = io.StringIO()
+    writer = CsvWriter(out)
+    writer.start_list(ITEMS)
+    writer.write(ITEMS[0])
+    assert out.getvalue().splitlines() == ["name,id,extra,tags", "sna,1,,"]
+
+
+@pytest.mark.parametrize("indent", [0, 2, 4])
+@pytest.mark.parametrize(
+    "obj",
+    [
+        pytest.param(ITEMS, id="list"),
+        pytest.param([], id="empty"),
+        pytest.param({"a": 1, "b": ["é", None]}, id="object"),
+        pytest.param("text", id="text"),
+    ],
+)
+def test_json_yaml(obj, indent):
+    for items in (obj, iter(obj) if isinstance(obj, list) else obj):
+        out = io.StringIO()
+        write_json(items, out, indent=indent)
+        assert out.getvalue() == json.dumps(obj, indent=indent, ensure_ascii=False) + "\n"
+
+    for items in (obj, iter(obj) if isinstance(obj, list) else obj):
+        out = io.StringIO()
+        write_yaml(items, out, indent=indent)
+        assert out.getvalue() == yaml.dump(obj, indent=indent)
+
+
+def test_json_yaml_columnar():
+    data = ColumnarData({"name": ["a", "b"], "count": [1, 2]})
+    out = io.StringIO()
+    write_json(data, out)
+    assert json.loads(out.getvalue()) == [{"name": "a", "count": 1}, {"name": "b", "count": 2}]
+
+    out = io.StringIO()
+    write_yaml(data, out)
+    assert yaml.safe_load(out.getvalue()) == [{"name": "a", "count": 1}, {"name": "b", "count": 2}]